@@ -42,6 +42,10 @@ class ProjectManifest(BaseModel):
     cycles: list[CycleManifest] = Field(default_factory=list)
     last_updated: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    def get_cycle(self, cycle_id: str) -> CycleManifest | None:
+        """Return the cycle with the given ID, or None if it is not in the manifest."""
+        return next((c for c in self.cycles if c.id == cycle_id), None)
+
 
 class FileArtifact(BaseModel):
     """Generated or modified file artifact"""
@@ -18,23 +18,28 @@ class JulesSessionNodes:
         """Initialize with reference to JulesClient for API calls."""
         self.client = jules_client
 
+    @staticmethod
+    def _copy_state(state: JulesSessionState, *mutable_fields: str) -> JulesSessionState:
+        """Shallow-copy the state, giving fresh copies only to the sets a node mutates.
+
+        Every other field is only ever reassigned by the nodes, so sharing it with
+        the incoming state is safe and avoids a full deep copy per node invocation.
+        """
+        return state.model_copy(update={f: set(getattr(state, f)) for f in mutable_fields})
+
     def _compute_diff(
         self, original: JulesSessionState, current: JulesSessionState
     ) -> dict[str, Any]:
         """Compute dictionary of changed fields for LangGraph checkpointer."""
-        updates = {}
-        for field in current.model_fields:
-            old_val = getattr(original, field)
-            new_val = getattr(current, field)
-            if old_val != new_val:
-                updates[field] = new_val
-        return updates
+        orig = original.__dict__
+        # Fields still shared with the original (identity) are unchanged by construction.
+        return {k: v for k, v in current.__dict__.items() if v is not orig[k] and v != orig[k]}
 
     async def monitor_session(self, _state_in: JulesSessionState) -> dict[str, Any]:  # noqa: C901, PLR0912, PLR0915
         """Monitor Jules session and detect state changes with batched polling."""
         from ac_cdd_core.config import settings
 
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in, "processed_activity_ids")
 
         # Batch polling loop to reduce graph steps
         # Poll for (monitor_batch_size * monitor_poll_interval_seconds) seconds per LangGraph invocation
@@ -255,7 +260,7 @@ class JulesSessionNodes:
 
     async def answer_inquiry(self, _state_in: JulesSessionState) -> dict[str, Any]:
         """Answer Jules' inquiry using Manager Agent."""
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in, "processed_activity_ids")
 
         if not state.current_inquiry or not state.current_inquiry_id:
             state.status = SessionStatus.MONITORING
@@ -311,7 +316,7 @@ class JulesSessionNodes:
 
     async def validate_completion(self, _state_in: JulesSessionState) -> dict[str, Any]:  # noqa: C901
         """Validate if COMPLETED state is genuine or if work is still ongoing."""
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in, "processed_completion_ids")
 
         try:
             async with httpx.AsyncClient() as client:
@@ -397,7 +402,7 @@ class JulesSessionNodes:
           progressUpdated, sessionCompleted, sessionFailed
         None of these contain a pullRequest field.
         """
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in)
 
         if not state.raw_data:
             state.status = SessionStatus.REQUESTING_PR_CREATION
@@ -492,7 +497,7 @@ class JulesSessionNodes:
         This node is only reached when COMPLETED state has no PR in session outputs.
         We do one final re-fetch before sending any message, in case raw_data was stale.
         """
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in)
 
         # Final safety check: re-fetch session outputs before sending any message.
         # AUTO_CREATE_PR mode should create the PR automatically. If we reach this node
@@ -539,7 +544,7 @@ class JulesSessionNodes:
 
     async def wait_for_pr(self, _state_in: JulesSessionState) -> dict[str, Any]:  # noqa: C901, PLR0912
         """Wait for PR creation after manual request, with session state re-validation."""
-        state = _state_in.model_copy(deep=True)
+        state = self._copy_state(_state_in, "processed_fallback_ids")
 
         await self.client._sleep(10)
         state.fallback_elapsed_seconds += 10
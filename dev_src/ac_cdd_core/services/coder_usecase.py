@@ -1,5 +1,4 @@
 import asyncio
-import re
 from datetime import UTC, datetime
 from typing import Any
 
@@ -9,6 +8,7 @@ from ac_cdd_core.enums import FlowStatus, WorkPhase
 from ac_cdd_core.services.jules_client import JulesClient
 from ac_cdd_core.state import CycleState
 from ac_cdd_core.state_manager import StateManager
+from ac_cdd_core.utils import render_template_section
 from rich.console import Console
 
 console = Console()
@@ -352,15 +352,7 @@ class CoderUseCase:
         """Build feedback injection block from template."""
         template = str(settings.get_template("AUDIT_FEEDBACK_INJECTION.md").read_text())
         result = template.replace("{{feedback}}", feedback)
+        result = str(render_template_section(result, "pr_url", keep=bool(pr_url)))
         if pr_url:
-            result = str(
-                re.sub(
-                    r"\{\{#pr_url\}\}\s*Previous PR: \{\{pr_url\}\}\s*\{\{/pr_url\}\}",
-                    f"Previous PR: {pr_url}",
-                    result,
-                    flags=re.DOTALL,
-                )
-            )
-        else:
-            result = str(re.sub(r"\{\{#pr_url\}\}.*?\{\{/pr_url\}\}", "", result, flags=re.DOTALL))
+            result = result.replace("{{pr_url}}", pr_url)
         return result.strip()
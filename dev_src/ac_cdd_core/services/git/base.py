@@ -13,9 +13,10 @@ class BaseGitManager:
         self.git_cmd = "git"
         self.gh_cmd = settings.tools.gh_cmd
 
-    async def _ensure_no_lock(self) -> None:
-        """Removes stale index.lock file if it exists."""
-        lock_file = Path.cwd() / ".git" / "index.lock"
+    async def _ensure_no_lock(self, lock_file: Path | None = None) -> None:
+        """Removes stale index.lock file if it exists (defaults to the cwd repository)."""
+        if lock_file is None:
+            lock_file = Path.cwd() / ".git" / "index.lock"
         if lock_file.exists():
             try:
                 # We assume single-threaded git access in this agent context.
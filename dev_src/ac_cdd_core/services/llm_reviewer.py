@@ -76,21 +76,21 @@ class LLMReviewer:
 
     def _format_as_markdown(self, report: AuditorReport) -> str:
         """Converts the deeply nested AuditorReport Pydantic object into a clean Markdown string for the Coder."""
-        feedback = "-> REVIEW_PASSED\n\n" if report.is_passed else "-> REVIEW_FAILED\n\n"
+        parts = ["-> REVIEW_PASSED\n\n" if report.is_passed else "-> REVIEW_FAILED\n\n"]
 
-        feedback += f"### Summary\n{report.summary}\n\n"
+        parts.append(f"### Summary\n{report.summary}\n\n")
 
         if report.issues:
-            feedback += "### Critical Issues\n"
+            parts.append("### Critical Issues\n")
             for issue in report.issues:
-                feedback += f"- **[{issue.category.upper()}]**: {issue.issue_description}\n"
-                feedback += f"  - **Location**: `{issue.file_path}`\n"
-                feedback += (
+                parts.append(f"- **[{issue.category.upper()}]**: {issue.issue_description}\n")
+                parts.append(f"  - **Location**: `{issue.file_path}`\n")
+                parts.append(
                     f"  - **Target Snippet**:\n    ```\n    {issue.target_code_snippet}\n    ```\n"
                 )
-                feedback += f"  - **Concrete Fix**: {issue.concrete_fix}\n\n"
+                parts.append(f"  - **Concrete Fix**: {issue.concrete_fix}\n\n")
 
-        return feedback
+        return "".join(parts)
 
     def _construct_prompt(
         self, target_files: dict[str, str], context_docs: dict[str, str], instruction: str
@@ -100,16 +100,19 @@ class LLMReviewer:
         """
 
         # 1. Context Section (Specs)
-        context_section = ""
-        for name, content in context_docs.items():
-            context_section += f"\nFile: {name} (READ-ONLY SPECIFICATION)\n```\n{content}\n```\n"
+        # Sections are joined once so large file contents are not re-copied per file.
+        context_section = "".join(
+            f"\nFile: {name} (READ-ONLY SPECIFICATION)\n```\n{content}\n```\n"
+            for name, content in context_docs.items()
+        )
 
         # 2. Target Section (Code)
-        target_section = ""
+        target_parts = []
         for name, content in target_files.items():
             # Add python hint for .py files
             lang = "python" if name.endswith(".py") else ""
-            target_section += f"\nFile: {name} (AUDIT TARGET)\n```{lang}\n{content}\n```\n"
+            target_parts.append(f"\nFile: {name} (AUDIT TARGET)\n```{lang}\n{content}\n```\n")
+        target_section = "".join(target_parts)
 
         # 3. Assemble Prompt
         return f"""
@@ -71,20 +71,20 @@ What defines a successful user experience?
             logger.warning(f"Template source directory not found: {source_dir}")
             return
 
-        template_files = [f.name for f in source_dir.glob("*.md")]
-
-        for template_file in template_files:
-            source_file = source_dir / template_file
+        # glob only yields existing sources, so the destination is the only path to check
+        for source_file in source_dir.glob("*.md"):
+            template_file = source_file.name
             dest_file = system_prompts_dir / template_file
 
-            if source_file.exists() and not dest_file.exists():
-                try:
-                    shutil.copy(source_file, dest_file)
-                    logger.info(f"✓ Created {template_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to copy {template_file}: {e}")
-            elif dest_file.exists():
+            if dest_file.exists():
                 logger.debug(f"Skipping {template_file} (already exists)")
+                continue
+
+            try:
+                shutil.copy(source_file, dest_file)
+                logger.info(f"✓ Created {template_file}")
+            except Exception as e:
+                logger.warning(f"Failed to copy {template_file}: {e}")
 
     def _create_env_example(self) -> Path:
         env_example_path = Path.cwd() / ".ac_cdd" / ".env.example"
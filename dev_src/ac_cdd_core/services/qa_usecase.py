@@ -10,6 +10,7 @@ from ac_cdd_core.services.jules_client import JulesClient
 from ac_cdd_core.services.llm_reviewer import LLMReviewer
 from ac_cdd_core.state import CycleState
 from ac_cdd_core.state_manager import StateManager
+from ac_cdd_core.utils import render_template_section
 from rich.console import Console
 from rich.panel import Panel
 
@@ -152,15 +153,11 @@ class QaUseCase:
                 console.print(
                     "[yellow]Could not reuse session. Starting new session with feedback...[/yellow]"
                 )
-                import re
-
                 injection_template = str(
                     settings.get_template("AUDIT_FEEDBACK_INJECTION.md").read_text()
                 )
                 injection = injection_template.replace("{{feedback}}", feedback)
-                injection = str(
-                    re.sub(r"\{\{#pr_url\}\}.*?\{\{/pr_url\}\}", "", injection, flags=re.DOTALL)
-                ).strip()
+                injection = render_template_section(injection, "pr_url", keep=False).strip()
                 full_prompt += f"\n\n{injection}"
                 qa_session_id = f"qa-{session_id}"
                 state.qa_retry_count = next_retries
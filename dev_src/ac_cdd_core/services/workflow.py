@@ -152,7 +152,7 @@ class WorkflowService:
         mgr = StateManager()
         manifest = mgr.load_manifest()
         if manifest:
-            cycle = next((c for c in manifest.cycles if c.id == cycle_id), None)
+            cycle = manifest.get_cycle(cycle_id)
             if cycle and cycle.status == "completed":
                 console.print(f"[yellow]Cycle {cycle_id} is already completed. Skipping.[/yellow]")
                 return
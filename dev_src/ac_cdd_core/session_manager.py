@@ -21,8 +21,8 @@ class SessionManager:
 
     STATE_FILE = "project_state.json"
 
-    def __init__(self) -> None:
-        self.git = GitManager()
+    def __init__(self, git: GitManager | None = None) -> None:
+        self.git = git or GitManager()
 
     async def load_manifest(self) -> ProjectManifest | None:
         """Loads manifest from the orphan state branch."""
@@ -69,10 +69,7 @@ class SessionManager:
         if not manifest:
             return None
 
-        for cycle in manifest.cycles:
-            if cycle.id == cycle_id:
-                return cycle
-        return None
+        return manifest.get_cycle(cycle_id)
 
     async def update_cycle_state(self, cycle_id: str, **kwargs: Any) -> None:
         """
@@ -85,7 +82,7 @@ class SessionManager:
             msg = "No active project manifest found."
             raise SessionValidationError(msg)
 
-        cycle = next((c for c in manifest.cycles if c.id == cycle_id), None)
+        cycle = manifest.get_cycle(cycle_id)
         if not cycle:
             msg = f"Cycle {cycle_id} not found in manifest."
             raise SessionValidationError(msg)
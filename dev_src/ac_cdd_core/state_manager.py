@@ -1,8 +1,8 @@
 """State management using local JSON file."""
 
 import contextlib
-import json
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -26,6 +26,9 @@ class StateManager:
         self.STATE_DIR = self.root / ".ac_cdd"
         self.STATE_FILE = self.STATE_DIR / "project_state_local.json"
 
+        # Manifest being edited inside transaction(); updates write here instead of to disk
+        self._pending: ProjectManifest | None = None
+
         # Migration: Rename old file if it exists and new one doesn't
         old_state_file = self.STATE_DIR / "project_state.json"
         if old_state_file.exists() and not self.STATE_FILE.exists():
@@ -47,9 +50,9 @@ class StateManager:
             return None
 
         try:
-            data = json.loads(self.STATE_FILE.read_text())
-            return ProjectManifest(**data)
-        except (json.JSONDecodeError, ValueError, TypeError):
+            # Parse and validate in one pass in pydantic-core, straight from the raw bytes
+            return ProjectManifest.model_validate_json(self.STATE_FILE.read_bytes())
+        except (ValueError, TypeError):
             logger.exception("Failed to load project manifest")
             return None
         except Exception:
@@ -64,8 +67,14 @@ class StateManager:
             manifest: ProjectManifest to save.
 
         Raises:
+            RuntimeError: If called with another manifest while transaction() is open.
             Exception: If save fails.
         """
+        # The open transaction would overwrite this write with its own manifest on exit
+        if self._pending is not None and manifest is not self._pending:
+            msg = "save_manifest() called inside transaction(); use the update_* methods."
+            raise RuntimeError(msg)
+
         try:
             # Ensure directory exists
             self.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -114,6 +123,10 @@ class StateManager:
             return f"0{cid}"
         return cid
 
+    def _find_cycle(self, manifest: ProjectManifest, cycle_id: str) -> CycleManifest | None:
+        """Look a cycle up by its ID as given, then by its normalized form."""
+        return manifest.get_cycle(cycle_id) or manifest.get_cycle(self._normalize_id(cycle_id))
+
     def get_cycle(self, cycle_id: str) -> CycleManifest | None:
         """
         Get a specific cycle from the manifest.
@@ -128,15 +141,58 @@ class StateManager:
         if not manifest:
             return None
 
-        normalized_id = self._normalize_id(cycle_id)
-        for cycle in manifest.cycles:
-            if cycle.id in (cycle_id, normalized_id):
-                return cycle
-        return None
+        return self._find_cycle(manifest, cycle_id)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["StateManager"]:
+        """
+        Group several updates into a single write of the state file.
+
+        Updates made inside the block are saved once on exit, and discarded if
+        the block raises. Nested transactions join the outer one.
+
+        Reads through load_manifest()/get_cycle() inside the block see the state
+        on disk, not the pending updates. Calling save_manifest() directly inside
+        the block raises RuntimeError rather than being overwritten on exit.
+
+        Raises:
+            SessionValidationError: If no manifest exists.
+
+        Example:
+            with manager.transaction():
+                manager.update_cycle_state("01", status="completed")
+                manager.update_cycle_state("02", status="in_progress")
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = self._manifest_for_update()
+        try:
+            yield self
+            self.save_manifest(self._pending)
+        finally:
+            self._pending = None
+
+    def _manifest_for_update(self) -> ProjectManifest:
+        """The manifest updates should modify: the open transaction's, or a fresh load."""
+        if self._pending is not None:
+            return self._pending
+
+        manifest = self.load_manifest()
+        if not manifest:
+            msg = "No active project manifest found."
+            raise SessionValidationError(msg)
+        return manifest
+
+    def _commit(self, manifest: ProjectManifest) -> None:
+        """Save an updated manifest, unless a transaction will save it on exit."""
+        if self._pending is None:
+            self.save_manifest(manifest)
 
     def update_cycle_state(self, cycle_id: str, **kwargs: Any) -> None:
         """
-        Update specific fields of a cycle and save immediately.
+        Update specific fields of a cycle and save immediately (or on exit of transaction()).
 
         Args:
             cycle_id: Cycle identifier.
@@ -148,16 +204,9 @@ class StateManager:
         Example:
             manager.update_cycle_state("01", status="in_progress", jules_session_id="...")
         """
-        manifest = self.load_manifest()
-        if not manifest:
-            msg = "No active project manifest found."
-            raise SessionValidationError(msg)
+        manifest = self._manifest_for_update()
 
-        normalized_id = self._normalize_id(cycle_id)
-        cycle = next(
-            (c for c in manifest.cycles if c.id in (cycle_id, normalized_id)),
-            None,
-        )
+        cycle = self._find_cycle(manifest, cycle_id)
         if not cycle:
             msg = f"Cycle {cycle_id} not found in manifest."
             raise SessionValidationError(msg)
@@ -171,13 +220,14 @@ class StateManager:
         cycle.updated_at = datetime.now(UTC)
 
         # Save
-        self.save_manifest(manifest)
+        self._commit(manifest)
 
         logger.info(f"Updated cycle {cycle_id}: {kwargs}")
 
     def update_project_state(self, **kwargs: Any) -> None:
         """
-        Update root-level fields of the project manifest and save immediately.
+        Update root-level fields of the project manifest and save immediately
+        (or on exit of transaction()).
 
         Args:
             **kwargs: Fields to update (e.g., qa_session_id="...").
@@ -185,10 +235,7 @@ class StateManager:
         Raises:
             SessionValidationError: If manifest not found.
         """
-        manifest = self.load_manifest()
-        if not manifest:
-            msg = "No active project manifest found."
-            raise SessionValidationError(msg)
+        manifest = self._manifest_for_update()
 
         # Update fields
         for key, value in kwargs.items():
@@ -201,6 +248,6 @@ class StateManager:
         manifest.last_updated = datetime.now(UTC)
 
         # Save
-        self.save_manifest(manifest)
+        self._commit(manifest)
 
         logger.info(f"Updated project state: {kwargs}")
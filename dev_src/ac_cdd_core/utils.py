@@ -102,6 +102,28 @@ def get_command_prefix() -> str:
     return "uv run manage.py"
 
 
+def render_template_section(text: str, tag: str, *, keep: bool) -> str:
+    """
+    Render every ``{{#tag}}...{{/tag}}`` section in a template.
+    Keeps the stripped section body when ``keep`` is True, otherwise drops the section.
+    The markers are fixed strings, so plain ``str.find`` is used instead of a DOTALL regex.
+    """
+    open_marker = f"{{{{#{tag}}}}}"
+    close_marker = f"{{{{/{tag}}}}}"
+    parts: list[str] = []
+    cursor = 0
+    while (start := text.find(open_marker, cursor)) != -1:
+        end = text.find(close_marker, start + len(open_marker))
+        if end == -1:
+            break
+        parts.append(text[cursor:start])
+        if keep:
+            parts.append(text[start + len(open_marker) : end].strip())
+        cursor = end + len(close_marker)
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
 class KeepAwake:
     """
     Context manager to prevent system sleep/suspension during long operations.
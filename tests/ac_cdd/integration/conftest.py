@@ -0,0 +1,31 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ac_cdd_core.services.git_ops import GitManager
+from ac_cdd_core.services.jules_client import JulesClient
+
+
+@pytest.fixture(scope="module")
+def mock_services() -> MagicMock:
+    """
+    Mocked service container shared by all tests in a module.
+    git/jules are spec'd against the real classes so typos fail fast and
+    attribute lookups stay limited to the real interface.
+    """
+    services = MagicMock()
+    services.git = AsyncMock(spec=GitManager)
+    # runner is an instance attribute, so the class spec does not expose it
+    services.git.runner = AsyncMock()
+    services.jules = AsyncMock(spec_set=JulesClient)
+    services.sandbox = MagicMock()
+    services.reviewer = MagicMock()
+    return services
+
+
+@pytest.fixture
+def mock_git_env(tmp_path: Path) -> Path:
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    (repo_dir / ".git").mkdir()
+    return repo_dir
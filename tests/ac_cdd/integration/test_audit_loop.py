@@ -1,24 +1,16 @@
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from ac_cdd_core.domain_models import AuditResult
 from ac_cdd_core.graph import GraphBuilder
 from ac_cdd_core.state import CycleState
+from langgraph.graph.state import CompiledStateGraph
 
 
-@pytest.mark.asyncio
-async def test_audit_rejection_loop() -> None:
-    """
-    Test that the audit loop functions correctly when changes are requested.
-    Verifies that the graph iterates through 3 auditors * 2 reviews each = 6 cycles.
-    """
-    # Mock Services
-    mock_services = MagicMock()
-    mock_services.git = AsyncMock()
-    mock_services.jules = AsyncMock()  # JulesClient is async
-    mock_services.sandbox = MagicMock()
-    mock_services.reviewer = MagicMock()
-
+@pytest.fixture(scope="module")
+def mock_services(mock_services: MagicMock) -> MagicMock:
+    """Configure the shared mocked services for the audit rejection loop."""
     # Mock Git to return a unique commit each time to simulate a new Jules commit
     commit_counter = [0]
 
@@ -39,11 +31,18 @@ async def test_audit_rejection_loop() -> None:
 
     # Mock Reviewer
     mock_services.reviewer.review_code = AsyncMock(return_value="CHANGES_REQUESTED: Please fix X.")
+    return mock_services
 
-    from unittest.mock import patch
-
-    from ac_cdd_core.domain_models import AuditResult
 
+@pytest.fixture(scope="module")
+def compiled_coder_graph(
+    mock_services: MagicMock,
+) -> tuple[GraphBuilder, CompiledStateGraph[CycleState, Any, Any, Any]]:
+    """
+    Build and compile the coder graph once per module.
+    The compiled graph holds references to the node mocks below, so tests vary
+    behaviour by reconfiguring those mocks rather than rebuilding the graph.
+    """
     # Mock PlanAuditor to avoid template/file errors during testing
     mock_auditor_instance = MagicMock()
 
@@ -74,7 +73,17 @@ async def test_audit_rejection_loop() -> None:
 
     builder.nodes.uat_evaluate_node = AsyncMock(return_value={"status": "completed"})
 
-    graph = builder.build_coder_graph()
+    return builder, builder.build_coder_graph()
+
+
+async def test_audit_rejection_loop(
+    compiled_coder_graph: tuple[GraphBuilder, CompiledStateGraph[CycleState, Any, Any, Any]],
+) -> None:
+    """
+    Test that the audit loop functions correctly when changes are requested.
+    Verifies that the graph iterates through 3 auditors * 2 reviews each = 6 cycles.
+    """
+    _, graph = compiled_coder_graph
 
     initial_state = CycleState(
         cycle_id="01",
@@ -5,10 +5,10 @@ from ac_cdd_core.domain_models import ProjectManifest
 from ac_cdd_core.services.workflow import WorkflowService
 
 
-@pytest.mark.asyncio
 class TestEndToEndWorkflow:
-    @pytest.fixture
-    def workflow(self) -> WorkflowService:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_workflow(cls) -> WorkflowService:
         # We need to ensure we patch dependencies that WorkflowService initializes
         with (
             patch("ac_cdd_core.services.workflow.ServiceContainer"),
@@ -16,6 +16,12 @@ class TestEndToEndWorkflow:
         ):
             return WorkflowService()
 
+    @pytest.fixture
+    def workflow(self, shared_workflow: WorkflowService) -> WorkflowService:
+        # The builder is a MagicMock; clear call history left by the previous test
+        shared_workflow.builder.reset_mock(return_value=True, side_effect=True)
+        return shared_workflow
+
     @patch("ac_cdd_core.services.workflow.StateManager")
     @patch("ac_cdd_core.services.workflow.ensure_api_key")
     async def test_full_gen_cycles_workflow(
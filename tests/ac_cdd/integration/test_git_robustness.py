@@ -1,19 +1,9 @@
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-import pytest
 from ac_cdd_core.services.git_ops import GitManager
 
 
-@pytest.fixture
-def mock_git_env(tmp_path: Path) -> Path:
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    (repo_dir / ".git").mkdir()
-    return repo_dir
-
-
-@pytest.mark.asyncio
 async def test_create_feature_branch_idempotency(mock_git_env: Path) -> None:
     """
     Verify that create_feature_branch doesn't fail if branch already exists.
@@ -52,7 +42,6 @@ async def test_create_feature_branch_idempotency(mock_git_env: Path) -> None:
         # If I want to simulate "exists", rev-parse should return 0.
 
 
-@pytest.mark.asyncio
 async def test_smart_checkout_dirty_recovery(mock_git_env: Path) -> None:
     """
     Verify smart checkout recovers from dirty state.
@@ -68,3 +57,13 @@ async def test_smart_checkout_dirty_recovery(mock_git_env: Path) -> None:
         await git.smart_checkout("new-branch")
 
         git._auto_commit_if_dirty.assert_called_once()
+
+
+async def test_ensure_no_lock_removes_file(mock_git_env: Path) -> None:
+    """A stale index.lock is deleted before git commands run."""
+    lock_file = mock_git_env / ".git" / "index.lock"
+    lock_file.touch()
+
+    await GitManager()._ensure_no_lock(lock_file)
+
+    assert not lock_file.exists()
@@ -1,14 +1,18 @@
+import os
+from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from ac_cdd_core.config import Settings
+from ac_cdd_core.sandbox import SandboxRunner
 from ac_cdd_core.service_container import ServiceContainer
+from ac_cdd_core.services.jules_client import JulesClient
 
 
-@pytest.fixture(autouse=True)
-def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Any:
-    """Mock the global settings object and env vars for all unit tests."""
+def _set_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set the API keys and model names unit tests build Settings from."""
     # Pre-emptively set environment variables to avoid pydantic-ai import errors
     monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy_key_for_test")
     monkeypatch.setenv("GEMINI_API_KEY", "dummy_key_for_test")
@@ -24,6 +28,12 @@ def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Any:
     monkeypatch.setenv("AC_CDD_REVIEWER__SMART_MODEL", "openai:gpt-4o")
     monkeypatch.setenv("AC_CDD_REVIEWER__FAST_MODEL", "openai:gpt-3.5-turbo")
 
+
+@pytest.fixture(autouse=True)
+def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Mock the global settings object and env vars for all unit tests."""
+    _set_test_env(monkeypatch)
+
     # Create a default Settings object (using defaults defined in class)
     try:
         real_defaults = Settings()
@@ -35,6 +45,63 @@ def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Any:
         yield real_defaults
 
 
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """Build Settings once per session; tests get isolated copies via ``settings``."""
+    # Built from the test env only: no developer AC_CDD_*/model overrides and no .env file
+    with pytest.MonkeyPatch.context() as mp:
+        for key in list(os.environ):
+            if key.startswith("AC_CDD_") or key in {"SMART_MODEL", "FAST_MODEL"}:
+                mp.delenv(key)
+        _set_test_env(mp)
+        mp.setitem(Settings.model_config, "env_file", None)
+        return Settings()
+
+
+@pytest.fixture
+def settings(base_settings: Settings) -> Settings:
+    """A deep copy of the shared Settings, safe to mutate within a test."""
+    return base_settings.model_copy(deep=True)
+
+
+@pytest.fixture(autouse=True)
+def no_asyncio_sleep() -> Any:
+    """Make asyncio.sleep a no-op so polling and retry loops never wait in unit tests."""
+    with patch("asyncio.sleep", new=AsyncMock(return_value=None)):
+        yield
+
+
+def _patch_httpx_client() -> Iterator[AsyncMock]:
+    """Patch httpx.AsyncClient globally and yield the client ``async with`` hands out."""
+    with patch("httpx.AsyncClient") as mock_cls:
+        client = AsyncMock()
+        mock_cls.return_value.__aenter__.return_value = client
+        mock_cls.return_value.__aexit__.return_value = None
+        yield client
+
+
+@pytest.fixture
+def mock_httpx() -> Any:
+    """The client yielded by ``async with httpx.AsyncClient()`` (patched globally)."""
+    yield from _patch_httpx_client()
+
+
+@pytest.fixture(scope="class")
+def class_httpx() -> Any:
+    """Like mock_httpx, but patched once for a whole test class."""
+    yield from _patch_httpx_client()
+
+
+@pytest.fixture
+def nodes_httpx() -> Any:
+    """The client used by JulesSessionNodes, which imports httpx at module level."""
+    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_module:
+        mock_module.codes.OK = 200
+        client = mock_module.AsyncClient.return_value
+        client.__aenter__.return_value = client
+        yield client
+
+
 @pytest.fixture
 def mock_file_patcher() -> MagicMock:
     return MagicMock()
@@ -62,6 +129,18 @@ def mock_jules() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_sandbox_spec() -> MagicMock:
+    """SandboxRunner mock; spec_set also rejects attributes the real class lacks."""
+    return MagicMock(spec_set=SandboxRunner)
+
+
+@pytest.fixture
+def mock_jules_spec() -> MagicMock:
+    """JulesClient mock; unlike ``mock_jules``, spec_set makes async methods AsyncMocks."""
+    return MagicMock(spec_set=JulesClient)
+
+
 @pytest.fixture
 def mock_reviewer() -> MagicMock:
     return MagicMock()
@@ -72,6 +151,71 @@ def mock_git() -> MagicMock:
     return MagicMock()
 
 
+class FakeGit:
+    """Plain stand-in for GitManager exposing only the async calls the auditor makes."""
+
+    def __init__(self) -> None:
+        self.checkout_pr = AsyncMock()
+        self.checkout_branch = AsyncMock()
+        self.pull_changes = AsyncMock()
+        self.get_current_commit = AsyncMock()
+        self.get_pr_base_branch = AsyncMock(return_value="main")
+        self.get_changed_files = AsyncMock(return_value=[])
+        self.runner = SimpleNamespace(run_command=AsyncMock(return_value=("", "", 0)))
+
+
+# Canned (stdout, stderr, code) per tool: mypy fails, ruff passes, nothing is gitignored.
+_STATIC_CHECK_RESPONSES = {
+    "mypy": ("mypy failure", "error", 1),
+    "ruff": ("ruff success", "", 0),
+    "check-ignore": ("", "", 1),
+}
+
+
+async def _static_checks_run_command(
+    cmd: list[str], check: bool = False, **kwargs: Any
+) -> tuple[str, str, int]:
+    for tool, response in _STATIC_CHECK_RESPONSES.items():
+        if tool in cmd:
+            return response
+    return "", "", 0
+
+
+@pytest.fixture
+def static_checks_runner() -> Any:
+    """run_command side effect for auditor static-analysis tests."""
+    return _static_checks_run_command
+
+
+@pytest.fixture
+def fake_git() -> FakeGit:
+    return FakeGit()
+
+
+# Templates CoderUseCase renders audit feedback into; any other template reads "Instruction".
+_CODER_TEMPLATES = {
+    "AUDIT_FEEDBACK_MESSAGE.md": "Instruction {{feedback}}",
+    "AUDIT_FEEDBACK_INJECTION.md": (
+        "# PREVIOUS AUDIT FEEDBACK (MUST FIX)\n\n{{feedback}}\n\n"
+        "{{#pr_url}}\nPrevious PR: {{pr_url}}\n{{/pr_url}}"
+    ),
+}
+
+
+def _coder_template(name: str) -> SimpleNamespace:
+    return SimpleNamespace(read_text=lambda: _CODER_TEMPLATES.get(name, "Instruction"))
+
+
+@pytest.fixture
+def coder_settings(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """In-memory stand-in for the settings CoderUseCase reads templates and file lists from."""
+    stub = SimpleNamespace(
+        get_template=_coder_template, get_target_files=list, get_context_files=list
+    )
+    monkeypatch.setattr("ac_cdd_core.services.coder_usecase.settings", stub)
+    return stub
+
+
 @pytest.fixture
 def mock_services(
     mock_file_patcher: MagicMock,
@@ -100,3 +244,13 @@ def mock_agent_result() -> Any:
         return result
 
     return _create_result
+
+
+@pytest.fixture
+def async_seq() -> Any:
+    """Factory for an AsyncMock that returns ``values`` in order, one per await."""
+
+    def _create(*values: Any) -> AsyncMock:
+        return AsyncMock(side_effect=list(values))
+
+    return _create
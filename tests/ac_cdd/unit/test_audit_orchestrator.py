@@ -35,7 +35,6 @@ def orchestrator(mock_jules: MagicMock, mock_auditor: MagicMock) -> AuditOrchest
     return AuditOrchestrator()
 
 
-@pytest.mark.asyncio
 async def test_run_session_approved_first_try(
     orchestrator: AuditOrchestrator, mock_jules: MagicMock, mock_auditor: MagicMock
 ) -> None:
@@ -54,7 +53,6 @@ async def test_run_session_approved_first_try(
     mock_jules.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_run_session_rejected_then_approved(
     orchestrator: AuditOrchestrator, mock_jules: MagicMock, mock_auditor: MagicMock
 ) -> None:
@@ -96,7 +94,6 @@ async def test_run_session_rejected_then_approved(
     mock_jules.approve_plan.assert_called_with("sess-1", "plan-2")
 
 
-@pytest.mark.asyncio
 async def test_max_retries_exceeded(
     orchestrator: AuditOrchestrator, mock_jules: MagicMock, mock_auditor: MagicMock
 ) -> None:
@@ -1,34 +1,33 @@
-from unittest.mock import AsyncMock, MagicMock
+from typing import cast
+from unittest.mock import MagicMock
 
-import pytest
 from ac_cdd_core.enums import FlowStatus
 from ac_cdd_core.services.auditor_usecase import AuditorUseCase
+from ac_cdd_core.services.git_ops import GitManager
 from ac_cdd_core.state import CycleState
 
+from .conftest import FakeGit
+
 
 class TestAuditPolling:
     """Tests for the Audit Polling Logic in AuditorUseCase."""
 
-    @pytest.mark.asyncio
-    async def test_audit_polling_pulls_changes(self) -> None:
+    async def test_audit_polling_pulls_changes(
+        self, mock_jules_spec: MagicMock, fake_git: FakeGit
+    ) -> None:
         """
         Verifies that when the auditor detects the same commit that was already audited,
         and Jules is still running, it returns 'WAITING_FOR_JULES' to let LangGraph loop.
         """
-        mock_jules = MagicMock()
-        mock_git = AsyncMock()
         mock_llm = MagicMock()
 
         # Git: current commit matches the already-audited commit
-        mock_git.checkout_pr = AsyncMock()
-        mock_git.get_current_commit = AsyncMock(return_value="commit_A")
-        mock_git.get_pr_base_branch = AsyncMock(return_value="main")
-        mock_git.get_changed_files = AsyncMock(return_value=["file.py"])
+        fake_git.get_current_commit.return_value = "commit_A"
 
         # Jules is still in progress (active, non-terminal state)
-        mock_jules.get_session_state = AsyncMock(return_value="IN_PROGRESS")
+        mock_jules_spec.get_session_state.return_value = "IN_PROGRESS"
 
-        usecase = AuditorUseCase(mock_jules, mock_git, mock_llm)
+        usecase = AuditorUseCase(mock_jules_spec, cast(GitManager, fake_git), mock_llm)
 
         state = CycleState(
             cycle_id="99",
@@ -44,4 +43,6 @@ class TestAuditPolling:
         # Should short-circuit with WAITING_FOR_JULES when commit hasn't changed
         assert result["status"] == FlowStatus.WAITING_FOR_JULES
         assert result["last_audited_commit"] == "commit_A"
-        mock_jules.get_session_state.assert_called_with("sessions/123")
+        mock_jules_spec.get_session_state.assert_called_with("sessions/123")
+        # Early return: the diff/review stage is never reached
+        fake_git.get_changed_files.assert_not_awaited()
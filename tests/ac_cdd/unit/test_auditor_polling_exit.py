@@ -1,39 +1,37 @@
-from typing import Any
+from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from ac_cdd_core.graph_nodes import CycleNodes
+from ac_cdd_core.services.git_ops import GitManager
 from ac_cdd_core.state import CycleState
 
+from .conftest import FakeGit
+
 
 class TestAuditorPollingExit:
     """Tests for auditor_node polling logic."""
 
-    @pytest.mark.asyncio
-    async def test_auditor_breaks_on_completed_session(self) -> None:
+    async def test_auditor_breaks_on_completed_session(
+        self, mock_sandbox_spec: MagicMock, mock_jules_spec: MagicMock, fake_git: FakeGit
+    ) -> None:
         """Verifies that polling breaks if Jules session is COMPLETED."""
         # Setup mocks
-        sandbox = MagicMock()
-        jules = MagicMock()
-        jules.get_session_state = AsyncMock(return_value="COMPLETED")
+        mock_jules_spec.get_session_state = AsyncMock(return_value="COMPLETED")
 
-        nodes = CycleNodes(sandbox, jules)
-        nodes.git = AsyncMock()
+        nodes = CycleNodes(mock_sandbox_spec, mock_jules_spec)
+        nodes.git = cast(GitManager, fake_git)
 
         # Git behavior:
         # get_current_commit returns same hash "abc" (no new commit)
-        nodes.git.get_current_commit = AsyncMock(return_value="abc")
-        nodes.git.pull_changes = AsyncMock()
-        nodes.git.checkout_pr = AsyncMock()  # Skip PR checkout logic
-        nodes.git.get_changed_files = AsyncMock(return_value=["test.py"])  # To proceed to review
-        nodes.git.runner = AsyncMock()  # Used in static analysis
+        fake_git.get_current_commit.return_value = "abc"
+        fake_git.get_changed_files.return_value = ["test.py"]  # To proceed to review
 
         async def mock_run_command(*args: Any, **kwargs: Any) -> tuple[str, str, int]:
             if isinstance(args[0], list) and "check-ignore" in args[0]:
                 return ("", "", 1)
             return ("", "", 0)
 
-        nodes.git.runner.run_command = AsyncMock(side_effect=mock_run_command)
+        fake_git.runner.run_command.side_effect = mock_run_command
 
         # Mock reviewer to avoid LLM call
         nodes.llm_reviewer.review_code = AsyncMock(return_value="NO ISSUES FOUND -> REVIEW_PASSED")
@@ -51,7 +49,7 @@ class TestAuditorPollingExit:
 
         # Assertions
         # It should have called get_session_state
-        assert jules.get_session_state.called
+        assert mock_jules_spec.get_session_state.called
         # Because Jules is "COMPLETED", it does NOT return waiting_for_jules,
         # it proceeds with auditing the same commit.
         assert result["status"] == "approved"
@@ -1,14 +1,16 @@
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 from ac_cdd_core.enums import FlowStatus
 from ac_cdd_core.services.auditor_usecase import AuditorUseCase
 from ac_cdd_core.state import CycleState
 
 
-@pytest.mark.asyncio
-async def test_auditor_node_includes_static_errors() -> None:
+@patch.object(AuditorUseCase, "_read_files", new_callable=AsyncMock)
+@patch("ac_cdd_core.services.auditor_usecase.settings")
+async def test_auditor_node_includes_static_errors(
+    mock_settings: MagicMock, mock_read: AsyncMock, static_checks_runner: Any
+) -> None:
     """
     Verify that if static analysis fails, the feedback includes errors and status is rejected.
     AuditorUseCase is tested directly (no CycleNodes wrapper needed).
@@ -25,20 +27,8 @@ async def test_auditor_node_includes_static_errors() -> None:
     mock_git.get_changed_files = AsyncMock(return_value=["src/test.py"])
     mock_git.checkout_branch = AsyncMock()
 
-    async def mock_run_command_side_effect(
-        cmd: list[str], check: bool = False, **kwargs: Any
-    ) -> tuple[str, str, int]:
-        cmd_str = " ".join(cmd)
-        if "mypy" in cmd_str:
-            return "mypy failure", "error", 1  # Fail
-        if "ruff" in cmd_str:
-            return "ruff success", "", 0  # Pass
-        if "check-ignore" in cmd_str:
-            return "", "", 1  # 1 = NOT gitignored
-        return "", "", 0
-
     mock_git.runner = MagicMock()
-    mock_git.runner.run_command = AsyncMock(side_effect=mock_run_command_side_effect)
+    mock_git.runner.run_command = AsyncMock(side_effect=static_checks_runner)
 
     # LLM mock: returns approval text
     mock_llm.review_code = AsyncMock(return_value="NO ISSUES FOUND")
@@ -47,21 +37,17 @@ async def test_auditor_node_includes_static_errors() -> None:
 
     state = CycleState(cycle_id="99", pr_url="http://pr", feature_branch="feat/1")
 
-    with (
-        patch("ac_cdd_core.services.auditor_usecase.settings") as mock_settings,
-        patch.object(usecase, "_read_files", new_callable=AsyncMock) as mock_read,
-    ):
-        mock_settings.get_context_files.return_value = []
-        mock_settings.get_template.return_value = MagicMock(
-            read_text=MagicMock(return_value="review these files")
-        )
-        mock_settings.get_target_files.return_value = ["src/test.py"]
-        mock_settings.reviewer.smart_model = "gpt-4o"
-        mock_settings.reviewer.fast_model = "gpt-3.5-turbo"
-        mock_settings.AUDITOR_MODEL_MODE = "smart"
-        mock_read.return_value = {"src/test.py": "x = 1"}
-
-        result = await usecase.execute(state)
+    mock_settings.get_context_files.return_value = []
+    mock_settings.get_template.return_value = MagicMock(
+        read_text=MagicMock(return_value="review these files")
+    )
+    mock_settings.get_target_files.return_value = ["src/test.py"]
+    mock_settings.reviewer.smart_model = "gpt-4o"
+    mock_settings.reviewer.fast_model = "gpt-3.5-turbo"
+    mock_settings.AUDITOR_MODEL_MODE = "smart"
+    mock_read.return_value = {"src/test.py": "x = 1"}
+
+    result = await usecase.execute(state)
 
     # Assertions
     assert result["status"] == FlowStatus.REJECTED
@@ -1,6 +1,6 @@
 """Tests for auto-merge logic in WorkflowService.finalize_session."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from ac_cdd_core.domain_models import ProjectManifest
@@ -16,83 +16,77 @@ def workflow() -> WorkflowService:
         return WorkflowService()
 
 
-@pytest.mark.asyncio
-async def test_finalize_creates_final_pr(workflow: WorkflowService) -> None:
+@patch("ac_cdd_core.services.workflow.ensure_api_key")
+@patch("ac_cdd_core.services.workflow.GitManager")
+@patch("ac_cdd_core.services.workflow.StateManager")
+async def test_finalize_creates_final_pr(
+    mock_sm_cls: MagicMock,
+    mock_git_cls: MagicMock,
+    _mock_ensure_api_key: MagicMock,
+    workflow: WorkflowService,
+) -> None:
     """finalize_session calls create_final_pr with integration branch from manifest."""
     manifest = ProjectManifest(
         project_session_id="p1",
         feature_branch="feat/p1",
         integration_branch="dev/p1/integration",
     )
-
-    with (
-        patch("ac_cdd_core.services.workflow.StateManager") as mock_sm_cls,
-        patch("ac_cdd_core.services.workflow.GitManager") as mock_git_cls,
-        patch("ac_cdd_core.services.workflow.ensure_api_key"),
-    ):
-        mock_sm_cls.return_value.load_manifest.return_value = manifest
-
-        mock_git = AsyncMock()
-        mock_git.create_final_pr = AsyncMock(return_value="https://github.com/repo/pull/1")
-        mock_git_cls.return_value = mock_git
-        workflow.git = mock_git
-
-        # Patch _archive_and_reset_state to avoid file system operations
-        workflow._archive_and_reset_state = AsyncMock()
-
+    mock_sm_cls.return_value.load_manifest.return_value = manifest
+
+    mock_git = AsyncMock()
+    mock_git.create_final_pr = AsyncMock(return_value="https://github.com/repo/pull/1")
+    mock_git_cls.return_value = mock_git
+    workflow.git = mock_git
+
+    # Patch _archive_and_reset_state to avoid file system operations
+    workflow._archive_and_reset_state = AsyncMock()
+
+    await workflow.finalize_session(project_session_id=None)
+
+    mock_git.create_final_pr.assert_awaited_once()
+    call_kwargs = mock_git.create_final_pr.await_args.kwargs
+    assert call_kwargs["integration_branch"] == "dev/p1/integration"
+    assert "p1" in call_kwargs["title"]
+
+
+@pytest.mark.parametrize(
+    ("manifest", "create_final_pr_error"),
+    [
+        pytest.param(None, None, id="no_session"),
+        pytest.param(
+            ProjectManifest(
+                project_session_id="p1",
+                feature_branch="feat/p1",
+                integration_branch="dev/p1/integration",
+            ),
+            RuntimeError("Merge conflict"),
+            id="merge_failure",
+        ),
+    ],
+)
+@patch("sys.exit", side_effect=SystemExit(1))
+@patch("ac_cdd_core.services.workflow.ensure_api_key")
+@patch("ac_cdd_core.services.workflow.GitManager")
+@patch("ac_cdd_core.services.workflow.StateManager")
+async def test_finalize_exits_on_failure(
+    mock_sm_cls: MagicMock,
+    mock_git_cls: MagicMock,
+    _mock_ensure_api_key: MagicMock,
+    mock_exit: MagicMock,
+    *,
+    workflow: WorkflowService,
+    manifest: ProjectManifest | None,
+    create_final_pr_error: Exception | None,
+) -> None:
+    """finalize_session exits with 1 when there is no session or create_final_pr fails."""
+    mock_sm_cls.return_value.load_manifest.return_value = manifest
+
+    mock_git = AsyncMock()
+    mock_git.create_final_pr = AsyncMock(side_effect=create_final_pr_error)
+    mock_git_cls.return_value = mock_git
+    workflow._archive_and_reset_state = AsyncMock()
+
+    with pytest.raises(SystemExit):
         await workflow.finalize_session(project_session_id=None)
 
-        mock_git.create_final_pr.assert_awaited_once()
-        call_kwargs = mock_git.create_final_pr.await_args.kwargs
-        assert call_kwargs["integration_branch"] == "dev/p1/integration"
-        assert "p1" in call_kwargs["title"]
-
-
-@pytest.mark.asyncio
-async def test_finalize_exits_when_no_session(workflow: WorkflowService) -> None:
-    """finalize_session calls sys.exit if no manifest found."""
-    import sys
-
-    with (
-        patch("ac_cdd_core.services.workflow.StateManager") as mock_sm_cls,
-        patch("ac_cdd_core.services.workflow.ensure_api_key"),
-        patch.object(sys, "exit") as mock_exit,
-    ):
-        mock_sm_cls.return_value.load_manifest.return_value = None
-        mock_exit.side_effect = SystemExit(1)
-
-        with pytest.raises(SystemExit):
-            await workflow.finalize_session(project_session_id=None)
-
-        mock_exit.assert_called_once_with(1)
-
-
-@pytest.mark.asyncio
-async def test_finalize_merge_failure_is_handled(workflow: WorkflowService) -> None:
-    """finalize_session handles create_final_pr failure gracefully (exits)."""
-    import sys
-
-    manifest = ProjectManifest(
-        project_session_id="p1",
-        feature_branch="feat/p1",
-        integration_branch="dev/p1/integration",
-    )
-
-    with (
-        patch("ac_cdd_core.services.workflow.StateManager") as mock_sm_cls,
-        patch("ac_cdd_core.services.workflow.GitManager") as mock_git_cls,
-        patch("ac_cdd_core.services.workflow.ensure_api_key"),
-        patch.object(sys, "exit") as mock_exit,
-    ):
-        mock_sm_cls.return_value.load_manifest.return_value = manifest
-
-        mock_git = AsyncMock()
-        mock_git.create_final_pr = AsyncMock(side_effect=RuntimeError("Merge conflict"))
-        mock_git_cls.return_value = mock_git
-        workflow.git = mock_git
-        mock_exit.side_effect = SystemExit(1)
-
-        with pytest.raises(SystemExit):
-            await workflow.finalize_session(project_session_id=None)
-
-        mock_exit.assert_called_once_with(1)
+    mock_exit.assert_called_once_with(1)
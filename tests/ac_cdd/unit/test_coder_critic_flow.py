@@ -5,7 +5,6 @@ from ac_cdd_core.services.coder_usecase import CoderUseCase
 from ac_cdd_core.state import CycleState
 from ac_cdd_core.domain_models import CycleManifest
 
-@pytest.mark.asyncio
 class TestCoderCriticFlow:
     @pytest.fixture
     def mock_jules(self) -> MagicMock:
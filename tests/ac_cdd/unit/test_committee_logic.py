@@ -7,7 +7,6 @@ from ac_cdd_core.graph_nodes import CycleNodes
 from ac_cdd_core.state import CycleState
 
 
-@pytest.mark.asyncio
 async def test_committee_logic_flow() -> None:
     # Mock settings
     mock_settings = MagicMock()
@@ -98,7 +97,6 @@ async def test_committee_logic_flow() -> None:
         assert route == "coder_session"
 
 
-@pytest.mark.asyncio
 async def test_committee_pipeline_handover() -> None:
     """Test pipeline handover: when review limit reached, move to next auditor."""
     # Mock settings: 2 Auditors × 1 Review each (small for testing)
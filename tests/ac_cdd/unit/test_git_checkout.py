@@ -1,13 +1,11 @@
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 from ac_cdd_core.services.git.checkout import GitCheckoutMixin
 
 
 class TestGitCheckout:
     """Tests for GitCheckoutMixin."""
 
-    @pytest.mark.asyncio
     async def test_pull_changes_uses_rebase(self) -> None:
         """Verifies that pull_changes uses --rebase."""
 
@@ -6,14 +6,21 @@ import pytest
 from ac_cdd_core.services.git_ops import GitManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_runner() -> Generator[Any, None, None]:
+    # Patched once per module; _reset_runner clears call state between tests.
     with patch("ac_cdd_core.services.git.base.ProcessRunner") as MockRunner:
         runner_instance = MockRunner.return_value
         runner_instance.run_command = AsyncMock()
         yield runner_instance
 
 
+@pytest.fixture(autouse=True)
+def _reset_runner(mock_runner: Any) -> Generator[None, None, None]:
+    yield
+    mock_runner.run_command.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def git_manager(mock_runner: Any) -> GitManager:
     # Mock settings to prevent loading real config
@@ -25,7 +32,6 @@ def git_manager(mock_runner: Any) -> GitManager:
         return manager
 
 
-@pytest.mark.asyncio
 async def test_merge_pr_immediate_success(git_manager: GitManager, mock_runner: Any) -> None:
     """Test that immediate merge is tried first and succeeds."""
     # Mock behavior: Immediate merge succeeds (code 0)
@@ -51,7 +57,6 @@ async def test_merge_pr_immediate_success(git_manager: GitManager, mock_runner:
     assert "--delete-branch" in merge_cmd
 
 
-@pytest.mark.asyncio
 async def test_merge_pr_fallback_to_auto(git_manager: GitManager, mock_runner: Any) -> None:
     """Test fallback to auto-merge when immediate merge fails due to status checks."""
 
@@ -79,7 +84,6 @@ async def test_merge_pr_fallback_to_auto(git_manager: GitManager, mock_runner: A
     assert "--auto" in cmd3
 
 
-@pytest.mark.asyncio
 async def test_merge_pr_failure_no_fallback(git_manager: GitManager, mock_runner: Any) -> None:
     """Test that we do NOT fallback to auto-merge for non-recoverable errors (e.g. conflict)."""
 
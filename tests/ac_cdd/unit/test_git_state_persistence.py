@@ -4,7 +4,6 @@ import pytest
 from ac_cdd_core.services.git_ops import GitManager
 
 
-@pytest.mark.asyncio
 class TestGitStatePersistence:
     @pytest.fixture
     def git_manager(self) -> GitManager:
@@ -2,6 +2,7 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from ac_cdd_core.domain_models import CycleManifest
 from ac_cdd_core.graph import GraphBuilder
 from ac_cdd_core.service_container import ServiceContainer
 from ac_cdd_core.state import CycleState
@@ -50,21 +51,18 @@ def graph_builder(services: ServiceContainer) -> GraphBuilder:
     return GraphBuilder(services)
 
 
-@pytest.mark.asyncio
 async def test_architect_graph_structure(graph_builder: GraphBuilder) -> None:
     """Test that architect graph is built correctly."""
     graph = graph_builder.build_architect_graph()
     assert isinstance(graph, CompiledStateGraph)
 
 
-@pytest.mark.asyncio
 async def test_coder_graph_structure(graph_builder: GraphBuilder) -> None:
     """Test that coder graph is built correctly."""
     graph = graph_builder.build_coder_graph()
     assert isinstance(graph, CompiledStateGraph)
 
 
-@pytest.mark.asyncio
 async def test_architect_graph_execution(services: ServiceContainer, mock_jules: MagicMock) -> None:
     """Test architect graph execution flow."""
     with patch("ac_cdd_core.graph_nodes.GitManager") as mock_git_cls:
@@ -90,7 +88,6 @@ async def test_architect_graph_execution(services: ServiceContainer, mock_jules:
     assert result["project_session_id"].startswith("architect-")
 
 
-@pytest.mark.asyncio
 async def test_coder_graph_execution(services: ServiceContainer, mock_jules: MagicMock) -> None:
     """Test coder graph execution flow."""
     initial_state = CycleState(cycle_id="01", iteration_count=0)
@@ -104,10 +101,8 @@ async def test_coder_graph_execution(services: ServiceContainer, mock_jules: Mag
         mock_git.get_remote_url = AsyncMock(return_value="https://github.com/repo")
 
         mock_sm = mock_sm_cls.return_value
-        mock_manifest = MagicMock()
-        mock_manifest.branch_name = "feature-abc"
-        mock_manifest.jules_session_id = None
-        mock_sm.get_cycle.return_value = mock_manifest
+        # A real model, so fields like pr_url keep their declared types
+        mock_sm.get_cycle.return_value = CycleManifest(id="01", branch_name="feature-abc")
 
         # Mock Reviewer (for new flow: auditor_node)
         mock_reviewer_instance = mock_reviewer_cls.return_value
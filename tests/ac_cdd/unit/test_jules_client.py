@@ -18,17 +18,6 @@ def mock_client() -> Generator[JulesClient, None, None]:
         yield client
 
 
-@pytest.fixture
-def mock_httpx() -> Generator[AsyncMock, None, None]:
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_instance = AsyncMock()
-        # Setup context manager
-        mock_cls.return_value.__aenter__.return_value = mock_instance
-        mock_cls.return_value.__aexit__.return_value = None
-        yield mock_instance
-
-
-@pytest.mark.asyncio
 async def test_wait_for_completion_sucess_first_try(
     mock_client: JulesClient, mock_httpx: AsyncMock
 ) -> None:
@@ -51,7 +40,6 @@ async def test_wait_for_completion_sucess_first_try(
     mock_client._sleep.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_wait_for_completion_loop_success(
     mock_client: JulesClient, mock_httpx: AsyncMock
 ) -> None:
@@ -87,7 +75,6 @@ async def test_wait_for_completion_loop_success(
     assert mock_client._sleep.call_count >= expected_calls
 
 
-@pytest.mark.asyncio
 async def test_wait_for_completion_timeout(mock_client: JulesClient, mock_httpx: AsyncMock) -> None:
     """Test timeout behaves correctly."""
     mock_client.timeout = 0.001
@@ -107,7 +94,6 @@ async def test_wait_for_completion_timeout(mock_client: JulesClient, mock_httpx:
         await mock_client.wait_for_completion("sessions/123")
 
 
-@pytest.mark.asyncio
 async def test_interactive_inquiry_handling(
     mock_client: JulesClient, mock_httpx: AsyncMock
 ) -> None:
@@ -1,216 +1,174 @@
-import unittest
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import chain, repeat
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+from ac_cdd_core.services.jules.inquiry_handler import JulesInquiryHandler
 from ac_cdd_core.services.jules_client import JulesClient
 
-
-class TestJulesClientLogic(unittest.IsolatedAsyncioTestCase):
-    def setUp(self) -> None:
-        # Patch dependencies to avoid real API calls or Auth
-        self.auth_patcher = patch("google.auth.default", return_value=(MagicMock(), "test-project"))
-        self.auth_patcher.start()
-
-        # Initialize client
-        with patch.object(JulesClient, "__init__", lambda x: None):  # Skip init
-            self.client = JulesClient()
-            self.client.base_url = "https://mock.api"
-            self.client.timeout = 5
-            self.client.poll_interval = 0.1
-            self.client.console = MagicMock()
-            self.client.manager_agent = AsyncMock()
-            self.client.manager_agent.run.return_value = MagicMock(output="Manager Reply")
-            self.client.credentials = MagicMock()
-            self.client._get_headers = MagicMock(return_value={})
-            self.client.credentials.token = "mock_token"  # noqa: S105
-            self.client._sleep = AsyncMock()
-
-            # FIX: Add context_builder
-            self.client.context_builder = MagicMock()
-            self.client.context_builder.build_question_context = AsyncMock(
-                return_value="mock context"
-            )
-
-            # FIX: Add inquiry handler back since __init__ is skipped
-            from ac_cdd_core.services.jules.inquiry_handler import JulesInquiryHandler
-
-            self.client.inquiry_handler = JulesInquiryHandler(
-                manager_agent=self.client.manager_agent,
-                context_builder=MagicMock(),
-                client_ref=self.client,
-            )
-
-            # FIX: Add api_client mock which is now used by wait_for_completion
-            self.client.api_client = MagicMock()
-            self.client.api_client.api_key = "mock_key"
-
-    def tearDown(self) -> None:
-        self.auth_patcher.stop()
-
-    @patch("asyncio.sleep", return_value=None)
-    @patch("httpx.AsyncClient")
-    async def test_prioritize_inquiry_over_completed_state(
-        self, mock_httpx_cls: Any, _mock_sleep: Any
-    ) -> None:
-        """
-        Verify correct inquiry semantics:
-        - agentMessaged (Jules internal monologue e.g. Root Cause Analysis) is IGNORED.
-        - inquiryAsked in AWAITING_USER_FEEDBACK state triggers Manager Agent reply.
-
-        Old behavior (wrong): the code replied to any agentMessaged regardless of state.
-        New behavior (correct): ONLY inquiryAsked + AWAITING_USER_FEEDBACK triggers a reply.
-        """
-        mock_client = AsyncMock()
-        mock_httpx_cls.return_value.__aenter__.return_value = mock_client
-
-        session_id = "sessions/123"
-        monologue_id = "sessions/123/activities/monologue"
-        question_id = "sessions/123/activities/question"
-
-        self.client.list_activities = MagicMock(return_value=[])
-        self.client._send_message = AsyncMock()
-
-        call_counts: dict[str, int] = {"state": 0, "activities": 0}
-
-        def state_response(call_n: int) -> MagicMock:
-            mock = MagicMock()
-            mock.status_code = 200
-            if call_n == 1:
-                mock.json.return_value = {"state": "IN_PROGRESS", "outputs": []}
-            elif call_n == 2:
-                mock.json.return_value = {"state": "AWAITING_USER_FEEDBACK", "outputs": []}
-            else:
-                mock.json.return_value = {
-                    "state": "COMPLETED",
-                    "outputs": [{"pullRequest": {"url": "http://github.com/pr/1"}}],
-                }
-            return mock
-
-        def activities_response(call_n: int) -> MagicMock:
-            mock = MagicMock()
-            mock.status_code = 200
-            if call_n == 1:
-                # Monologue while IN_PROGRESS - must be ignored
-                mock.json.return_value = {
-                    "activities": [
-                        {
-                            "name": monologue_id,
-                            "agentMessaged": {"agentMessage": "Root Cause Analysis..."},
-                        }
-                    ]
-                }
-            elif call_n == 2:
-                # Genuine question while AWAITING_USER_FEEDBACK - must be answered
-                # Official Jules API: AWAITING_USER_FEEDBACK + agentMessaged.agentMessage
-                # (inquiryAsked does NOT exist in the official Jules API)
-                mock.json.return_value = {
-                    "activities": [
-                        {
-                            "name": question_id,
-                            "agentMessaged": {"agentMessage": "Which file should I edit?"},
-                        }
-                    ]
-                }
-            else:
-                mock.json.return_value = {"activities": []}
-            return mock
-
-        async def dynamic_get(url: str, **kwargs: Any) -> MagicMock:
-            if "activities" in url:
-                call_counts["activities"] += 1
-                return activities_response(call_counts["activities"])
-            call_counts["state"] += 1
-            return state_response(call_counts["state"])
-
-        mock_client.get.side_effect = dynamic_get
-
-        result = await self.client.wait_for_completion(session_id)
-
-        # Manager agent MUST have been called exactly once (for the genuine inquiryAsked only)
-        self.client._send_message.assert_called_once()
-        assert result["pr_url"] == "http://github.com/pr/1"
-
-    @patch("asyncio.sleep", return_value=None)
-    @patch("httpx.AsyncClient")
-    async def test_deduplication_of_existing_activities(
-        self, mock_httpx_cls: Any, _mock_sleep: Any
-    ) -> None:
-        """
-        Verify that existing activities are IGNORED and do not trigger a reply.
-        """
-        mock_client = AsyncMock()
-        mock_httpx_cls.return_value.__aenter__.return_value = mock_client
-
-        session_id = "sessions/123"
-        old_activity_id = "sessions/123/activities/old"
-
-        self.client.list_activities = MagicMock(
-            return_value=[
-                {"name": old_activity_id, "agentMessaged": {"agentMessage": "Old Question"}}
-            ]
-        )
-
-        self.client._send_message = AsyncMock()
-
-        # Responses
-        r_session_completed = MagicMock()
-        r_session_completed.status_code = 200
-        r_session_completed.json.return_value = {"state": "IN_PROGRESS", "outputs": []}
-
-        r_acts_old = MagicMock()
-        r_acts_old.status_code = 200
-        r_acts_old.json.return_value = {
-            "activities": [
-                {"name": old_activity_id, "agentMessaged": {"agentMessage": "Old Question"}}
-            ]
-        }
-
-        r_session_success = MagicMock()
-        r_session_success.status_code = 200
-        r_session_success.json.return_value = {
-            "state": "COMPLETED",
-            "outputs": [{"pullRequest": {"url": "http://github.com/pr/1"}}],
-        }
-
-        r_acts_empty = MagicMock()
-        r_acts_empty.status_code = 200
-        r_acts_empty.json.return_value = {"activities": []}
-
-        r_acts_logging = MagicMock()
-        r_acts_logging.status_code = 200
-        r_acts_logging.json.return_value = {"activities": []}
-
-        # Sequence:
-        # Iteration 1:
-        # 1. get(session) -> COMPLETED
-        # 2. get(activities) (Check Inquiry) -> Old Activity (Ignored)
-        #    -> Logic: if duplicate, continue (skip rest of loop)
-        # Iteration 2:
-        # 3. get(session) -> COMPLETED
-        # 4. get(activities) (Check Inquiry) -> Empty
-        #    -> Success Check -> Returns PR
-
-        call_counts = {"state": 0, "activities": 0}
-
-        async def dynamic_get(url: str, **kwargs: Any) -> MagicMock:
-            if url.endswith("/activities"):
-                call_counts["activities"] += 1
-                if call_counts["activities"] == 1:
-                    return r_acts_old
-                if call_counts["activities"] == 2:
-                    return r_acts_logging
-                return r_acts_empty
-            call_counts["state"] += 1
-            if call_counts["state"] in (1, 2):
-                return r_session_completed
-            return r_session_success
-
-        mock_client.get.side_effect = dynamic_get
-
-        await self.client.wait_for_completion(session_id)
-
-        self.client._send_message.assert_not_called()
-
-
-if __name__ == "__main__":
-    unittest.main()
+SESSION_ID = "sessions/123"
+MONOLOGUE_ID = "sessions/123/activities/monologue"
+QUESTION_ID = "sessions/123/activities/question"
+OLD_ACTIVITY_ID = "sessions/123/activities/old"
+
+
+@dataclass(frozen=True)
+class FakeResp:
+    """Minimal stand-in for httpx.Response: the client only reads status and JSON."""
+
+    status_code: int
+    payload: dict[str, Any]
+
+    def json(self) -> dict[str, Any]:
+        return self.payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+R_SESSION_IN_PROGRESS = FakeResp(200, {"state": "IN_PROGRESS", "outputs": []})
+R_SESSION_AWAITING_FEEDBACK = FakeResp(200, {"state": "AWAITING_USER_FEEDBACK", "outputs": []})
+R_SESSION_COMPLETED = FakeResp(
+    200,
+    {"state": "COMPLETED", "outputs": [{"pullRequest": {"url": "http://github.com/pr/1"}}]},
+)
+R_ACTS_EMPTY = FakeResp(200, {"activities": []})
+# Monologue while IN_PROGRESS - must be ignored
+R_ACTS_MONOLOGUE = FakeResp(
+    200,
+    {
+        "activities": [
+            {"name": MONOLOGUE_ID, "agentMessaged": {"agentMessage": "Root Cause Analysis..."}}
+        ]
+    },
+)
+# Genuine question while AWAITING_USER_FEEDBACK - must be answered
+# Official Jules API: AWAITING_USER_FEEDBACK + agentMessaged.agentMessage
+# (inquiryAsked does NOT exist in the official Jules API)
+R_ACTS_QUESTION = FakeResp(
+    200,
+    {
+        "activities": [
+            {"name": QUESTION_ID, "agentMessaged": {"agentMessage": "Which file should I edit?"}}
+        ]
+    },
+)
+R_ACTS_OLD = FakeResp(
+    200,
+    {"activities": [{"name": OLD_ACTIVITY_ID, "agentMessaged": {"agentMessage": "Old Question"}}]},
+)
+
+
+async def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+async def _question_context(*args: Any, **kwargs: Any) -> str:
+    return "mock context"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_google_auth() -> Iterator[None]:
+    # Patch dependencies to avoid real API calls or Auth
+    with patch("google.auth.default", return_value=(MagicMock(), "test-project")):
+        yield
+
+
+@pytest.fixture
+def jules_client() -> JulesClient:
+    # Skip __init__ and wire up only what wait_for_completion touches
+    jules = JulesClient.__new__(JulesClient)
+    # Typed loosely so methods can be swapped for stubs without method-assign errors
+    client: Any = jules
+    client.base_url = "https://mock.api"
+    client.timeout = 5
+    client.poll_interval = 0.1
+    client.console = MagicMock()
+    client.manager_agent = AsyncMock()
+    client.manager_agent.run.return_value = MagicMock(output="Manager Reply")
+    # Attribute-only collaborators are plain namespaces rather than MagicMocks
+    client.credentials = SimpleNamespace(token="mock_token")  # noqa: S106
+    client._get_headers = MagicMock(return_value={})
+    client._sleep = _noop
+    client.context_builder = SimpleNamespace(build_question_context=_question_context)
+    client.inquiry_handler = JulesInquiryHandler(
+        manager_agent=client.manager_agent,
+        context_builder=MagicMock(),
+        client_ref=client,
+    )
+    # api_client is used by wait_for_completion
+    client.api_client = SimpleNamespace(api_key="mock_key")
+    return jules
+
+
+async def test_prioritize_inquiry_over_completed_state(
+    mock_httpx: AsyncMock, jules_client: JulesClient
+) -> None:
+    """
+    Verify correct inquiry semantics:
+    - agentMessaged (Jules internal monologue e.g. Root Cause Analysis) is IGNORED.
+    - inquiryAsked in AWAITING_USER_FEEDBACK state triggers Manager Agent reply.
+
+    Old behavior (wrong): the code replied to any agentMessaged regardless of state.
+    New behavior (correct): ONLY inquiryAsked + AWAITING_USER_FEEDBACK triggers a reply.
+    """
+    # The last response of each queue repeats for however many polls remain
+    state_responses = chain(
+        [R_SESSION_IN_PROGRESS, R_SESSION_AWAITING_FEEDBACK], repeat(R_SESSION_COMPLETED)
+    )
+    activities_responses = chain([R_ACTS_MONOLOGUE, R_ACTS_QUESTION], repeat(R_ACTS_EMPTY))
+
+    async def dynamic_get(url: str, **_: Any) -> FakeResp:
+        # Activity URLs may carry a ?pageSize query, so match on the path segment
+        if "/activities" in url:
+            return next(activities_responses)
+        return next(state_responses)
+
+    mock_httpx.get.side_effect = dynamic_get
+
+    with patch.object(jules_client, "_send_message") as send_message:
+        result = await jules_client.wait_for_completion(SESSION_ID)
+
+    # Manager agent MUST have been called exactly once (for the genuine inquiryAsked only)
+    send_message.assert_called_once()
+    assert result["pr_url"] == "http://github.com/pr/1"
+
+
+async def test_deduplication_of_existing_activities(
+    mock_httpx: AsyncMock, jules_client: JulesClient
+) -> None:
+    """
+    Verify that existing activities are IGNORED and do not trigger a reply.
+    """
+    # Sequence:
+    # Startup (_initialize_processed_ids):
+    # 1. get(session) -> IN_PROGRESS
+    # 2. get(activities) -> Old Activity, recorded as already processed
+    # Polling:
+    # 3. get(session) -> AWAITING_USER_FEEDBACK
+    # 4. get(activities) (Check Inquiry) -> Old Activity again
+    #    -> Would be answered as a question, but it is a duplicate, so it is skipped
+    # 5. get(session) -> COMPLETED -> Success Check -> Returns PR
+    #    (any later activity fetches get an empty list)
+
+    state_responses = chain(
+        [R_SESSION_IN_PROGRESS, R_SESSION_AWAITING_FEEDBACK], repeat(R_SESSION_COMPLETED)
+    )
+    activities_responses = chain([R_ACTS_OLD, R_ACTS_OLD], repeat(R_ACTS_EMPTY))
+
+    async def dynamic_get(url: str, **_: Any) -> FakeResp:
+        # Activity URLs may carry a ?pageSize query, so match on the path segment
+        if "/activities" in url:
+            return next(activities_responses)
+        return next(state_responses)
+
+    mock_httpx.get.side_effect = dynamic_get
+
+    with patch.object(jules_client, "_send_message") as send_message:
+        result = await jules_client.wait_for_completion(SESSION_ID)
+
+    assert result["pr_url"] == "http://github.com/pr/1"
+    send_message.assert_not_called()
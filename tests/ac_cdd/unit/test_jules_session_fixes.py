@@ -1,201 +1,139 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from ac_cdd_core.jules_session_nodes import JulesSessionNodes, SessionStatus
 from ac_cdd_core.jules_session_state import JulesSessionState
 
 
-@pytest.mark.asyncio
-async def test_monitor_session_batching() -> None:
-    """Verify monitor_session loops internally for batch polling."""
-    # Setup
-    mock_client = MagicMock()
-    mock_client._get_headers.return_value = {}
-    mock_client._sleep = AsyncMock()
-    mock_client.inquiry_handler = MagicMock()
-    mock_client.inquiry_handler.handle_plan_approval = AsyncMock()
-    mock_client.inquiry_handler.check_for_inquiry = AsyncMock(return_value=None)
-    mock_client._handle_manual_input = AsyncMock()
-
-    loop = asyncio.get_running_loop()
-    start_time = loop.time()
-    nodes = JulesSessionNodes(mock_client)
-    state = JulesSessionState(session_url="http://test/session", start_time=start_time)
-
-    # Mock httpx in the TARGET MODULE
-    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_httpx:
-        # CONFIGURE MOCK CONSTANTS
-        mock_httpx.codes.OK = 200
-
-        mock_instance = mock_httpx.AsyncClient.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"state": "IN_PROGRESS", "outputs": []}
-
-        # Use AsyncMock for get
-        mock_instance.get = AsyncMock(return_value=mock_resp)
-
-        # Run
-        new_state = await nodes.monitor_session(state)
-
-        # Verify
-        assert mock_instance.get.call_count == 24
-        assert mock_client._sleep.call_count == 12
-        assert "status" not in new_state
+async def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for client coroutines the tests never assert on."""
 
 
-@pytest.mark.asyncio
-async def test_monitor_session_returns_early_on_change() -> None:
-    """Verify monitor_session returns early if state changes to COMPLETED."""
-    # Setup
+def _make_client() -> MagicMock:
+    """Jules client mock with the collaborators monitor_session awaits."""
     mock_client = MagicMock()
     mock_client._get_headers.return_value = {}
     mock_client._sleep = AsyncMock()
     mock_client.inquiry_handler = MagicMock()
-    mock_client.inquiry_handler.handle_plan_approval = AsyncMock()
-    mock_client.inquiry_handler.check_for_inquiry = AsyncMock(return_value=None)
-    mock_client._handle_manual_input = AsyncMock()
-
-    loop = asyncio.get_running_loop()
-    start_time = loop.time()
+    mock_client.inquiry_handler.handle_plan_approval = _noop
+    mock_client.inquiry_handler.check_for_inquiry = _noop
+    mock_client._handle_manual_input = _noop
+    return mock_client
+
+
+@dataclass(frozen=True)
+class FakeResp:
+    """Minimal stand-in for httpx.Response: the nodes only read status and JSON."""
+
+    status_code: int
+    payload: dict[str, Any]
+
+    def json(self) -> dict[str, Any]:
+        return self.payload
+
+
+# Built once: frozen and call-free, so sharing them across tests is safe
+_RESP_IN_PROGRESS = FakeResp(200, {"state": "IN_PROGRESS", "outputs": []})
+_RESP_COMPLETED = FakeResp(200, {"state": "COMPLETED", "outputs": []})
+_RESP_ACT_STALE = FakeResp(200, {"activities": [{"name": "act-123", "sessionCompleted": {}}]})
+
+
+@pytest.mark.parametrize(
+    ("responses", "validated", "expected_gets", "expected_sleeps", "expected_status"),
+    [
+        # Batch polling: loops internally 12 times, 2 GETs per loop, no status change
+        pytest.param([_RESP_IN_PROGRESS] * 24, False, 24, 12, None, id="batching"),
+        # Returns early once the state changes to COMPLETED
+        pytest.param(
+            [_RESP_IN_PROGRESS, _RESP_IN_PROGRESS, _RESP_COMPLETED],
+            False,
+            3,
+            1,
+            SessionStatus.VALIDATING_COMPLETION,
+            id="returns_early_on_change",
+        ),
+        # Already COMPLETED and validated: does NOT go back to validation
+        pytest.param([_RESP_COMPLETED] * 24, True, 24, 12, None, id="avoids_validation_loop"),
+    ],
+)
+async def test_monitor_session(
+    async_seq: Any,
+    nodes_httpx: MagicMock,
+    *,
+    responses: list[FakeResp],
+    validated: bool,
+    expected_gets: int,
+    expected_sleeps: int,
+    expected_status: SessionStatus | None,
+) -> None:
+    """Verify monitor_session batch polling and its early-exit conditions."""
+    mock_client = _make_client()
     nodes = JulesSessionNodes(mock_client)
-    state = JulesSessionState(session_url="http://test/session", start_time=start_time)
-
-    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_httpx:
-        mock_httpx.codes.OK = 200
-
-        mock_instance = mock_httpx.AsyncClient.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-
-        mock_resp_prog = MagicMock()
-        mock_resp_prog.status_code = 200
-        mock_resp_prog.json.return_value = {"state": "IN_PROGRESS", "outputs": []}
-
-        mock_resp_comp = MagicMock()
-        mock_resp_comp.status_code = 200
-        mock_resp_comp.json.return_value = {"state": "COMPLETED", "outputs": []}
-
-        mock_instance.get = AsyncMock(side_effect=[mock_resp_prog, mock_resp_prog, mock_resp_comp])
-
-        # Run
-        new_state = await nodes.monitor_session(state)
-
-        # Verify
-        assert mock_instance.get.call_count == 3
-        assert mock_client._sleep.call_count == 1
-        assert new_state["status"] == SessionStatus.VALIDATING_COMPLETION
-
-
-@pytest.mark.asyncio
-async def test_validate_completion_stale_detection() -> None:
-    """Verify validate_completion handles stale events correctly."""
-    # Setup
+    state = JulesSessionState(
+        session_url="http://test/session", start_time=asyncio.get_running_loop().time()
+    )
+    if validated:
+        state.jules_state = "COMPLETED"
+        state.completion_validated = True
+
+    nodes_httpx.get = async_seq(*responses)
+
+    new_state = await nodes.monitor_session(state)
+
+    assert nodes_httpx.get.call_count == expected_gets
+    assert mock_client._sleep.call_count == expected_sleeps
+    # None means still MONITORING: the diff does not contain 'status'
+    assert new_state.get("status") == expected_status
+
+
+@pytest.mark.parametrize(
+    ("previous_jules_state", "expected_status"),
+    [
+        # A completion event we already processed is stale
+        pytest.param("COMPLETED", None, id="stale_detection"),
+        # ...unless the session just transitioned IN_PROGRESS -> COMPLETED
+        pytest.param("IN_PROGRESS", SessionStatus.CHECKING_PR, id="stale_but_new_transition"),
+    ],
+)
+async def test_validate_completion(
+    nodes_httpx: MagicMock, previous_jules_state: str, expected_status: SessionStatus | None
+) -> None:
+    """Verify validate_completion handles already-processed completion events."""
     mock_client = MagicMock()
     mock_client._get_headers.return_value = {}
 
     nodes = JulesSessionNodes(mock_client)
     state = JulesSessionState(session_url="http://test/session")
     state.processed_completion_ids.add("act-123")
-    state.previous_jules_state = "COMPLETED"
-
-    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_httpx:
-        mock_httpx.codes.OK = 200
-
-        mock_instance = mock_httpx.AsyncClient.return_value
-        mock_instance.__aenter__.return_value = mock_instance
+    state.previous_jules_state = previous_jules_state
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "activities": [{"name": "act-123", "sessionCompleted": {}}],
-            "messages": [],
-        }
+    nodes_httpx.get = AsyncMock(return_value=_RESP_ACT_STALE)
 
-        # AsyncMock for get
-        mock_instance.get = AsyncMock(return_value=mock_resp)
+    new_state = await nodes.validate_completion(state)
 
-        # Run
-        new_state = await nodes.validate_completion(state)
+    assert new_state.get("status") == expected_status
 
-        # Verify
-        assert "status" not in new_state
 
-
-@pytest.mark.asyncio
-async def test_validate_completion_stale_but_new_transition() -> None:
-    """Verify validate_completion accepts stale event if transition is valid (IN_PROGRESS -> COMPLETED)."""
-    # Setup
+async def test_answer_inquiry_does_not_mutate_input_state() -> None:
+    """Verify nodes copy the sets they mutate and only report changed fields."""
     mock_client = MagicMock()
-    mock_client._get_headers.return_value = {}
+    mock_client.context_builder.build_question_context = AsyncMock(return_value="context")
+    mock_client.manager_agent.run = AsyncMock(return_value=MagicMock(output="reply"))
+    mock_client._send_message = _noop
+    mock_client._sleep = _noop
 
     nodes = JulesSessionNodes(mock_client)
-    state = JulesSessionState(session_url="http://test/session")
-    state.processed_completion_ids.add("act-123")
-    state.previous_jules_state = "IN_PROGRESS"
-
-    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_httpx:
-        mock_httpx.codes.OK = 200
-
-        mock_instance = mock_httpx.AsyncClient.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        # Fix mock structure: sessionCompleted is a key
-        mock_resp.json.return_value = {"activities": [{"name": "act-123", "sessionCompleted": {}}]}
-
-        mock_instance.get = AsyncMock(return_value=mock_resp)
-
-        # Run
-        new_state = await nodes.validate_completion(state)
-
-        # Verify
-        assert new_state["status"] == SessionStatus.CHECKING_PR
-
-
-@pytest.mark.asyncio
-async def test_monitor_session_avoids_validation_loop() -> None:
-    """Verify monitor_session does NOT go to validation if already validated."""
-    # Setup
-    mock_client = MagicMock()
-    mock_client._get_headers.return_value = {}
-    mock_client._sleep = AsyncMock()
-    mock_client.inquiry_handler = MagicMock()
-    mock_client.inquiry_handler.handle_plan_approval = AsyncMock()
-    mock_client.inquiry_handler.check_for_inquiry = AsyncMock(return_value=None)
-    mock_client._handle_manual_input = AsyncMock()
-
-    loop = asyncio.get_running_loop()
-    start_time = loop.time()
-    nodes = JulesSessionNodes(mock_client)
-    state = JulesSessionState(session_url="http://test/session", start_time=start_time)
-
-    # Pre-set state to COMPLETED and Validated
-    state.jules_state = "COMPLETED"
-    state.completion_validated = True
-
-    with patch("ac_cdd_core.jules_session_nodes.httpx") as mock_httpx:
-        mock_httpx.codes.OK = 200
-
-        mock_instance = mock_httpx.AsyncClient.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        # Jules is still completed
-        mock_resp.json.return_value = {"state": "COMPLETED", "outputs": []}
-
-        mock_instance.get = AsyncMock(return_value=mock_resp)
+    state = JulesSessionState(
+        session_url="http://test/session", current_inquiry="Question?", current_inquiry_id="act-1"
+    )
 
-        # Run
-        new_state = await nodes.monitor_session(state)
+    diff = await nodes.answer_inquiry(state)
 
-        # Verify
-        # Should not change status to VALIDATING_COMPLETION
-        # Should remain MONITORING (diff will not contain 'status')
-        assert "status" not in new_state
-        # Should have looped 12 times (batching) because it didn't exit early, 2 calls per loop
-        assert mock_instance.get.call_count == 24
+    assert diff["processed_activity_ids"] == {"act-1"}
+    assert diff["current_inquiry"] is None
+    assert "session_url" not in diff
+    assert state.processed_activity_ids == set()
+    assert state.current_inquiry_id == "act-1"
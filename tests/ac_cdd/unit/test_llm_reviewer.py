@@ -9,7 +9,6 @@ def reviewer() -> LLMReviewer:
     return LLMReviewer()
 
 
-@pytest.mark.asyncio
 async def test_review_code_success(reviewer: LLMReviewer) -> None:
     """Test successful code review call."""
     target_files = {"main.py": "print('hello')"}
@@ -49,7 +48,6 @@ async def test_review_code_success(reviewer: LLMReviewer) -> None:
         assert "File: main.py (AUDIT TARGET)" in prompt
 
 
-@pytest.mark.asyncio
 async def test_review_code_api_failure(reviewer: LLMReviewer) -> None:
     """Test error handling when API fails."""
     target_files = {"main.py": "content"}
@@ -1,23 +1,28 @@
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock
 
-import pytest
 from ac_cdd_core.enums import FlowStatus, WorkPhase
 from ac_cdd_core.graph_nodes import CycleNodes
-from ac_cdd_core.sandbox import SandboxRunner
-from ac_cdd_core.services.jules_client import JulesClient
 from ac_cdd_core.state import CycleState
 
 
+class _StubSandbox:
+    """Sandbox placeholder: uat_evaluate_node never touches the sandbox."""
+
+
+class _StubJules:
+    """Jules placeholder: uat_evaluate_node never touches the Jules client."""
+
+
 class TestPhaseTransition:
     """Validate state reset when transitioning between phases."""
 
-    @pytest.mark.asyncio
     async def test_refactor_phase_resets_final_fix(self) -> None:
         """Should reset final_fix flag on Refactor Phase transition."""
         # Setup mocks
-        mock_sandbox = MagicMock(spec=SandboxRunner)
-        mock_jules = MagicMock(spec=JulesClient)
-        nodes = CycleNodes(mock_sandbox, mock_jules)
+        sandbox: Any = _StubSandbox()
+        jules: Any = _StubJules()
+        nodes = CycleNodes(sandbox, jules)
         nodes.git = AsyncMock()  # Mock git manager
 
         # Simulate Coder Phase state with final_fix=True (which causes the bug)
@@ -19,7 +19,6 @@ def plan_auditor(mock_agent: MagicMock) -> PlanAuditor:
     return PlanAuditor()
 
 
-@pytest.mark.asyncio
 async def test_audit_plan_approved(plan_auditor: PlanAuditor, mock_agent: MagicMock) -> None:
     # Setup mock response
     expected_result = PlanAuditResult(status="APPROVED", reason="Plan looks good", feedback="")
@@ -41,7 +40,6 @@ async def test_audit_plan_approved(plan_auditor: PlanAuditor, mock_agent: MagicM
     mock_agent.run.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_audit_plan_rejected(plan_auditor: PlanAuditor, mock_agent: MagicMock) -> None:
     expected_result = PlanAuditResult(status="REJECTED", reason="Bad plan", feedback="Fix it")
     mock_run_result = MagicMock()
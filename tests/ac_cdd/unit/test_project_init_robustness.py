@@ -5,8 +5,19 @@ import pytest
 from ac_cdd_core.services.project import ProjectManager
 
 
-@pytest.mark.asyncio
-async def test_initialize_project_robustness(tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def templates_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # template_manager only copies from here, so the files are written once per session
+    templates_path = tmp_path_factory.mktemp("templates")
+    (templates_path / "ALL_SPEC.md").write_text("spec")
+    (templates_path / ".env.example").write_text("env")
+    (templates_path / ".gitignore.template").write_text("ignore")
+    return templates_path
+
+
+async def test_initialize_project_robustness(
+    tmp_path: Path, templates_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Verifies that initialize_project:
     1. Creates basic file structure
@@ -27,10 +38,9 @@ async def test_initialize_project_robustness(tmp_path: Path) -> None:
     # Mock ProcessRunner instance
     mock_runner_instance = AsyncMock()
 
-    # We need to mock the path to templates
-    templates_path = tmp_path / "templates"
+    # The code resolves .github and .gitignore from the cwd, so run inside tmp_path
+    monkeypatch.chdir(tmp_path)
 
-    # Mocking Path.cwd is critical because the code uses it to access .github and .gitignore
     with (
         patch("ac_cdd_core.services.project.settings", mock_settings),
         patch("ac_cdd_core.services.project_setup.template_manager.settings", mock_settings),
@@ -42,23 +52,10 @@ async def test_initialize_project_robustness(tmp_path: Path) -> None:
             "ac_cdd_core.services.project_setup.dependency_manager.ProcessRunner",
             return_value=mock_runner_instance,
         ),
-        patch("pathlib.Path.cwd", return_value=tmp_path),
-        patch(
-            "ac_cdd_core.services.project_setup.dependency_manager.Path.cwd", return_value=tmp_path
-        ),
-        patch(
-            "ac_cdd_core.services.project_setup.template_manager.Path.cwd", return_value=tmp_path
-        ),
     ):
-        # Setup mock template files since template_manager copies them
-        templates_path.mkdir(parents=True, exist_ok=True)
-        (templates_path / "ALL_SPEC.md").write_text("spec")
-        (templates_path / ".env.example").write_text("env")
-        (templates_path / ".gitignore.template").write_text("ignore")
-
         # Execute
         pm = ProjectManager()
-        await pm.initialize_project(str(templates_path))
+        await pm.initialize_project(str(templates_root))
 
         # --- Assertions ---
 
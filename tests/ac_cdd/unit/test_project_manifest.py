@@ -1,18 +1,41 @@
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime, tzinfo
 
 import pytest
 from ac_cdd_core.domain_models import CycleManifest, ProjectManifest
 
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]  # noqa: ARG003
+        return FROZEN_NOW
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _freeze() -> Iterator[None]:
+    # Module scope so the shared default_cycle is built with the frozen clock too
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("ac_cdd_core.domain_models.datetime", _FrozenDatetime)
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_cycle() -> CycleManifest:
+    # Read-only: tests that mutate a cycle must build their own
+    return CycleManifest(id="01")
+
 
 class TestProjectManifest:
-    def test_cycle_manifest_defaults(self) -> None:
+    def test_cycle_manifest_defaults(self, default_cycle: CycleManifest) -> None:
         """Test CycleManifest default values."""
-        cycle = CycleManifest(id="01")
+        cycle = default_cycle
         assert cycle.id == "01"
         assert cycle.status == "planned"
         assert cycle.jules_session_id is None
-        assert isinstance(cycle.created_at, datetime)
-        assert isinstance(cycle.updated_at, datetime)
+        assert cycle.created_at == FROZEN_NOW
+        assert cycle.updated_at == FROZEN_NOW
 
     def test_project_manifest_serialization(self) -> None:
         """Test full ProjectManifest serialization loop."""
@@ -34,6 +57,20 @@ class TestProjectManifest:
         assert restored.cycles[0].jules_session_id == "jules-1"
         assert restored.cycles[1].status == "planned"
 
+    def test_get_cycle(self) -> None:
+        """Test looking up a cycle by ID."""
+        manifest = ProjectManifest(
+            project_session_id="test-session-123",
+            feature_branch="dev/feature-123",
+            integration_branch="dev/test/integration",
+            cycles=[CycleManifest(id="01"), CycleManifest(id="02", status="in_progress")],
+        )
+
+        cycle = manifest.get_cycle("02")
+
+        assert cycle is manifest.cycles[1]
+        assert manifest.get_cycle("99") is None
+
     def test_manifest_validation(self) -> None:
         """Test validation rules."""
         # Missing required fields
@@ -7,7 +7,7 @@ from ac_cdd_core.services.coder_usecase import CoderUseCase
 from ac_cdd_core.state import CycleState
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("coder_settings")
 class TestResumeLogic:
     @pytest.fixture
     def mock_jules(self) -> MagicMock:
@@ -28,11 +28,7 @@ class TestResumeLogic:
         usecase = CoderUseCase(mock_jules)
         state = CycleState(cycle_id="01", iteration_count=1, resume_mode=True)
 
-        with patch("ac_cdd_core.services.coder_usecase.settings") as mock_settings:
-            mock_settings.get_template.return_value.read_text.return_value = "Instruction"
-            mock_settings.get_target_files.return_value = []
-            mock_settings.get_context_files.return_value = []
-            result = await usecase.execute(state)
+        result = await usecase.execute(state)
 
         mock_jules.wait_for_completion.assert_awaited_once_with("jules-existing-123")
         mock_jules.run_session.assert_not_awaited()
@@ -58,11 +54,7 @@ class TestResumeLogic:
         usecase = CoderUseCase(mock_jules)
         state = CycleState(cycle_id="01", iteration_count=1, resume_mode=True)
 
-        with patch("ac_cdd_core.services.coder_usecase.settings") as mock_settings:
-            mock_settings.get_template.return_value.read_text.return_value = "Instruction"
-            mock_settings.get_target_files.return_value = []
-            mock_settings.get_context_files.return_value = []
-            result = await usecase.execute(state)
+        result = await usecase.execute(state)
 
         mock_jules.run_session.assert_awaited_once()
         assert mock_jules.run_session.await_args.kwargs["require_plan_approval"] is False
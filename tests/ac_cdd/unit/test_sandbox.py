@@ -1,7 +1,6 @@
 import shlex
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 from ac_cdd_core.sandbox import SandboxRunner
 
 
@@ -15,7 +14,6 @@ def test_shlex_quoting() -> None:
     assert "'Line 1\nLine 2 (paren)'" in safe_str or '"Line 1\nLine 2 (paren)"' in safe_str
 
 
-@pytest.mark.asyncio
 async def test_sync_hash_reset_on_failure() -> None:
     """Verify that _last_sync_hash is reset to None when sandbox retry logic hits."""
     runner = SandboxRunner()
@@ -54,7 +52,6 @@ async def test_sync_hash_reset_on_failure() -> None:
         assert runner._last_sync_hash is None
 
 
-@pytest.mark.asyncio
 async def test_get_sandbox_creates_new() -> None:
     """Test that _get_sandbox creates new sandbox when none exists."""
     runner = SandboxRunner()
@@ -66,7 +63,6 @@ async def test_get_sandbox_creates_new() -> None:
         mock_create.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_sandbox_reuses_existing() -> None:
     """Test that _get_sandbox reuses existing sandbox."""
     runner = SandboxRunner()
@@ -79,7 +75,6 @@ async def test_get_sandbox_reuses_existing() -> None:
         mock_create.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_sync_to_sandbox_success() -> None:
     """Test successful sync to sandbox."""
     runner = SandboxRunner()
@@ -94,7 +89,6 @@ async def test_sync_to_sandbox_success() -> None:
         assert runner._last_sync_hash == "hash123"
 
 
-@pytest.mark.asyncio
 async def test_sync_to_sandbox_hash_unchanged() -> None:
     """Test that sync is skipped when hash unchanged."""
     runner = SandboxRunner()
@@ -111,7 +105,6 @@ async def test_sync_to_sandbox_hash_unchanged() -> None:
         mock_tarball.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_run_command_success() -> None:
     """Test successful command execution."""
     runner = SandboxRunner()
@@ -130,7 +123,6 @@ async def test_run_command_success() -> None:
         assert stdout == "output"
 
 
-@pytest.mark.asyncio
 async def test_run_command_retry_on_failure() -> None:
     """Test command retry logic on sandbox failure."""
     runner = SandboxRunner()
@@ -161,7 +153,6 @@ async def test_run_command_retry_on_failure() -> None:
         assert mock_create.called
 
 
-@pytest.mark.asyncio
 async def test_cleanup_sandbox() -> None:
     """Test sandbox cleanup."""
     runner = SandboxRunner()
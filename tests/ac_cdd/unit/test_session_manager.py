@@ -1,81 +1,74 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from ac_cdd_core.domain_models import ProjectManifest
 from ac_cdd_core.session_manager import SessionManager
 
 
-@pytest.mark.asyncio
 class TestSessionManager:
     @pytest.fixture
-    def manager(self) -> SessionManager:
-        return SessionManager()
+    def git(self) -> AsyncMock:
+        return AsyncMock()
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
-    async def test_load_manifest_success(
-        self, mock_read: AsyncMock, manager: SessionManager
-    ) -> None:
+    @pytest.fixture
+    def manager(self, git: AsyncMock) -> SessionManager:
+        return SessionManager(git=git)
+
+    async def test_load_manifest_success(self, git: AsyncMock, manager: SessionManager) -> None:
         json_data = '{"project_session_id": "p1", "feature_branch": "feat/p1", "integration_branch": "dev/p1", "cycles": []}'
-        mock_read.return_value = json_data
+        git.read_state_file.return_value = json_data
 
         manifest = await manager.load_manifest()
 
         assert manifest is not None
         assert manifest.project_session_id == "p1"
         assert isinstance(manifest, ProjectManifest)
-        mock_read.assert_awaited_once_with("project_state.json")
+        git.read_state_file.assert_awaited_once_with("project_state.json")
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
-    async def test_load_manifest_not_found(
-        self, mock_read: AsyncMock, manager: SessionManager
-    ) -> None:
-        mock_read.return_value = None
+    async def test_load_manifest_not_found(self, git: AsyncMock, manager: SessionManager) -> None:
+        git.read_state_file.return_value = None
 
         manifest = await manager.load_manifest()
 
         assert manifest is None
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
     async def test_load_manifest_invalid_json(
-        self, mock_read: AsyncMock, manager: SessionManager
+        self, git: AsyncMock, manager: SessionManager
     ) -> None:
-        mock_read.return_value = "{invalid_json}"
+        git.read_state_file.return_value = "{invalid_json}"
 
         manifest = await manager.load_manifest()
 
         assert manifest is None
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.save_state_file")
-    async def test_save_manifest(self, mock_save: AsyncMock, manager: SessionManager) -> None:
+    async def test_save_manifest(self, git: AsyncMock, manager: SessionManager) -> None:
         manifest = ProjectManifest(
             project_session_id="p1", feature_branch="feat/p1", integration_branch="dev/p1"
         )
 
         await manager.save_manifest(manifest, commit_msg="Test update")
 
-        mock_save.assert_awaited_once()
-        call_args = mock_save.await_args
+        git.save_state_file.assert_awaited_once()
+        call_args = git.save_state_file.await_args
         assert call_args is not None
         assert call_args[0][0] == "project_state.json"
         assert "p1" in call_args[0][1]  # Content
         assert call_args[0][2] == "Test update"
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.save_state_file")
-    async def test_create_manifest(self, mock_save: AsyncMock, manager: SessionManager) -> None:
+    async def test_create_manifest(self, git: AsyncMock, manager: SessionManager) -> None:
         manifest = await manager.create_manifest("p_new", "feat/p_new", "dev/p_new")
 
         assert manifest.project_session_id == "p_new"
-        mock_save.assert_awaited_once()
+        git.save_state_file.assert_awaited_once()
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
-    async def test_get_cycle(self, mock_read: AsyncMock, manager: SessionManager) -> None:
+    async def test_get_cycle(self, git: AsyncMock, manager: SessionManager) -> None:
         json_data = """
         {
             "project_session_id": "p1", "feature_branch": "feat/p1", "integration_branch": "dev/p1",
             "cycles": [{"id": "01", "status": "planned"}]
         }
         """
-        mock_read.return_value = json_data
+        git.read_state_file.return_value = json_data
 
         cycle = await manager.get_cycle("01")
         assert cycle is not None
@@ -84,34 +77,27 @@ class TestSessionManager:
         cycle = await manager.get_cycle("99")
         assert cycle is None
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.save_state_file")
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
-    async def test_update_cycle_state(
-        self, mock_read: AsyncMock, mock_save: AsyncMock, manager: SessionManager
-    ) -> None:
+    async def test_update_cycle_state(self, git: AsyncMock, manager: SessionManager) -> None:
         json_data = """
         {
             "project_session_id": "p1", "feature_branch": "feat/p1", "integration_branch": "dev/p1",
             "cycles": [{"id": "01", "status": "planned"}]
         }
         """
-        mock_read.return_value = json_data
+        git.read_state_file.return_value = json_data
 
         await manager.update_cycle_state("01", status="in_progress")
 
-        mock_save.assert_awaited_once()
-        content = mock_save.await_args
+        git.save_state_file.assert_awaited_once()
+        content = git.save_state_file.await_args
         assert content is not None
         content_str = content[0][1]
         assert '"status": "in_progress"' in content_str.replace(
             " ", ""
         ) or '"status":"in_progress"' in content_str.replace(" ", "")
 
-    @patch("ac_cdd_core.services.git_ops.GitManager.read_state_file")
-    async def test_update_cycle_not_found(
-        self, mock_read: AsyncMock, manager: SessionManager
-    ) -> None:
-        mock_read.return_value = (
+    async def test_update_cycle_not_found(self, git: AsyncMock, manager: SessionManager) -> None:
+        git.read_state_file.return_value = (
             '{"project_session_id": "p1", "integration_branch": "dev/p1", "cycles": []}'
         )
 
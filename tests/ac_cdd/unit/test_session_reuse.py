@@ -1,122 +1,99 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from ac_cdd_core.domain_models import AuditResult
+from ac_cdd_core.domain_models import AuditResult, CycleManifest
 from ac_cdd_core.enums import FlowStatus
 from ac_cdd_core.services.coder_usecase import CoderUseCase
 from ac_cdd_core.state import CycleState
 
 
+def _resolved(value: str) -> asyncio.Future[str]:
+    """A completed future, awaitable any number of times without a coroutine per call."""
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+@pytest.fixture(scope="module")
+def reject_state() -> CycleState:
+    # CoderUseCase only reads the state, so one rejected-audit retry state serves every test
+    return CycleState(
+        cycle_id="01",
+        status=FlowStatus.RETRY_FIX,
+        audit_result=AuditResult(
+            status="REJECTED", is_approved=False, reason="Needs work", feedback="Fix this issue"
+        ),
+    )
+
+
+@pytest.mark.usefixtures("coder_settings")
+@patch("ac_cdd_core.services.coder_usecase.StateManager")
 class TestSessionReuse:
     """Validate session reuse and fallback logic."""
 
-    @pytest.fixture
-    def mock_jules(self) -> MagicMock:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_jules(cls) -> MagicMock:
         jules = MagicMock()
         jules.run_session = AsyncMock()
         jules.wait_for_completion = AsyncMock()
-        jules.get_session_state = AsyncMock()
+        # Plain mock: tests hand it an already-resolved future (see _resolved)
+        jules.get_session_state = MagicMock()
         jules._send_message = AsyncMock()
-        jules._get_session_url = MagicMock(return_value="https://jules/session/url")
+        jules._get_session_url = MagicMock()
         return jules
 
-    @pytest.mark.asyncio
-    async def test_reuse_completed_session_for_auditor_reject(self, mock_jules: MagicMock) -> None:
+    @pytest.fixture(autouse=True)
+    def _reset_jules(self, mock_jules: MagicMock) -> None:
+        # mock_jules is shared by the class; drop the previous test's calls and behaviour
+        mock_jules.reset_mock(return_value=True, side_effect=True)
+        mock_jules._get_session_url.return_value = "https://jules/session/url"
+
+    async def test_reuse_completed_session_for_auditor_reject(
+        self, mock_manager_cls: MagicMock, mock_jules: MagicMock, reject_state: CycleState
+    ) -> None:
         """Should REUSE COMPLETED session for Auditor Reject (send feedback to same session)."""
-        mock_jules.get_session_state.return_value = "COMPLETED"
+        mock_jules.get_session_state.return_value = _resolved("COMPLETED")
         mock_jules.wait_for_completion.return_value = {"status": "success", "pr_url": "http://pr"}
 
-        mock_manifest = MagicMock()
-        mock_manifest.jules_session_id = "sessions/123"
-        mock_manifest.pr_url = None
-
-        audit = AuditResult(
-            status="REJECTED", is_approved=False, reason="Needs work", feedback="Fix this issue"
-        )
-        state = CycleState(
-            cycle_id="01",
-            status=FlowStatus.RETRY_FIX,
-            audit_result=audit,
-        )
+        mock_manifest = CycleManifest(id="01", jules_session_id="sessions/123", pr_url=None)
 
         usecase = CoderUseCase(mock_jules)
 
-        with patch("ac_cdd_core.services.coder_usecase.StateManager") as MockManager:
-            instance = MockManager.return_value
-            instance.get_cycle.return_value = mock_manifest
-
-            with patch("ac_cdd_core.services.coder_usecase.settings") as mock_settings:
+        mock_manager_cls.return_value.get_cycle.return_value = mock_manifest
 
-                def mock_get_template(name: str) -> MagicMock:
-                    m = MagicMock()
-                    if name == "AUDIT_FEEDBACK_MESSAGE.md":
-                        m.read_text.return_value = "Instruction {{feedback}}"
-                    else:
-                        m.read_text.return_value = "Instruction"
-                    return m
-
-                mock_settings.get_template.side_effect = mock_get_template
-                mock_settings.get_target_files.return_value = []
-                mock_settings.get_context_files.return_value = []
-                result = await usecase.execute(state)
+        result = await usecase.execute(reject_state)
 
         mock_jules.get_session_state.assert_called_with("sessions/123")
         mock_jules._send_message.assert_called_once()  # Feedback was sent to existing session
 
         # Verify the actual feedback content sent
-        sent_message = (
-            mock_jules._send_message.call_args.args[1]
-            if mock_jules._send_message.call_args.args
-            else mock_jules._send_message.call_args.kwargs.get("message", "")
-        )
+        args, kwargs = mock_jules._send_message.call_args
+        sent_message = args[1] if len(args) > 1 else kwargs["message"]
         assert "Fix this issue" in sent_message
 
         mock_jules.run_session.assert_not_called()
         assert result["status"] == FlowStatus.READY_FOR_AUDIT
 
-    @pytest.mark.asyncio
-    async def test_create_new_session_if_failed(self, mock_jules: MagicMock) -> None:
+    async def test_create_new_session_if_failed(
+        self, mock_manager_cls: MagicMock, mock_jules: MagicMock, reject_state: CycleState
+    ) -> None:
         """Should create NEW session if previous session FAILED."""
-        mock_jules.get_session_state.return_value = "FAILED"
+        mock_jules.get_session_state.return_value = _resolved("FAILED")
         mock_jules.run_session.return_value = {
             "session_name": "sessions/new_456",
             "status": "success",
             "pr_url": "http://pr-new",
         }
 
-        mock_manifest = MagicMock()
-        mock_manifest.jules_session_id = "sessions/123"
-        mock_manifest.pr_url = "https://pr"
-
-        audit = AuditResult(
-            status="REJECTED", is_approved=False, reason="Needs work", feedback="Fix this issue"
-        )
-        state = CycleState(
-            cycle_id="01",
-            status=FlowStatus.RETRY_FIX,
-            audit_result=audit,
-        )
+        mock_manifest = CycleManifest(id="01", jules_session_id="sessions/123", pr_url="https://pr")
 
         usecase = CoderUseCase(mock_jules)
 
-        with patch("ac_cdd_core.services.coder_usecase.StateManager") as MockManager:
-            instance = MockManager.return_value
-            instance.get_cycle.return_value = mock_manifest
-
-            with patch("ac_cdd_core.services.coder_usecase.settings") as mock_settings:
+        mock_manager_cls.return_value.get_cycle.return_value = mock_manifest
 
-                def mock_get_template(name: str) -> MagicMock:
-                    m = MagicMock()
-                    if name == "AUDIT_FEEDBACK_INJECTION.md":
-                        m.read_text.return_value = "# PREVIOUS AUDIT FEEDBACK (MUST FIX)\n\n{{feedback}}\n\n{{#pr_url}}\nPrevious PR: {{pr_url}}\n{{/pr_url}}"
-                    else:
-                        m.read_text.return_value = "Instruction"
-                    return m
-
-                mock_settings.get_template.side_effect = mock_get_template
-                mock_settings.get_target_files.return_value = []
-                mock_settings.get_context_files.return_value = []
-                await usecase.execute(state)
+        await usecase.execute(reject_state)
 
         mock_jules.get_session_state.assert_called_with("sessions/123")
         mock_jules._send_message.assert_not_called()  # Should NOT reuse FAILED session
@@ -126,54 +103,26 @@ class TestSessionReuse:
         assert "Fix this issue" in prompt
         assert "PREVIOUS AUDIT FEEDBACK" in prompt
 
-    @pytest.mark.asyncio
-    async def test_reuse_in_progress_session(self, mock_jules: MagicMock) -> None:
+    async def test_reuse_in_progress_session(
+        self, mock_manager_cls: MagicMock, mock_jules: MagicMock, reject_state: CycleState
+    ) -> None:
         """Should REUSE IN_PROGRESS session (original behavior)."""
-        mock_jules.get_session_state.return_value = "IN_PROGRESS"
+        mock_jules.get_session_state.return_value = _resolved("IN_PROGRESS")
         mock_jules.wait_for_completion.return_value = {"status": "success", "pr_url": "http://pr"}
 
-        mock_manifest = MagicMock()
-        mock_manifest.jules_session_id = "sessions/123"
-        mock_manifest.pr_url = None
-
-        audit = AuditResult(
-            status="REJECTED", is_approved=False, reason="Needs work", feedback="Fix this"
-        )
-        state = CycleState(
-            cycle_id="01",
-            status=FlowStatus.RETRY_FIX,
-            audit_result=audit,
-        )
+        mock_manifest = CycleManifest(id="01", jules_session_id="sessions/123", pr_url=None)
 
         usecase = CoderUseCase(mock_jules)
 
-        with patch("ac_cdd_core.services.coder_usecase.StateManager") as MockManager:
-            instance = MockManager.return_value
-            instance.get_cycle.return_value = mock_manifest
-
-            with patch("ac_cdd_core.services.coder_usecase.settings") as mock_settings:
-
-                def mock_get_template(name: str) -> MagicMock:
-                    m = MagicMock()
-                    if name == "AUDIT_FEEDBACK_MESSAGE.md":
-                        m.read_text.return_value = "Instruction {{feedback}}"
-                    else:
-                        m.read_text.return_value = "Instruction"
-                    return m
+        mock_manager_cls.return_value.get_cycle.return_value = mock_manifest
 
-                mock_settings.get_template.side_effect = mock_get_template
-                mock_settings.get_target_files.return_value = []
-                mock_settings.get_context_files.return_value = []
-                result = await usecase.execute(state)
+        result = await usecase.execute(reject_state)
 
         mock_jules._send_message.assert_called_once()  # Feedback was sent
 
         # Verify the actual feedback content sent
-        sent_message = (
-            mock_jules._send_message.call_args.args[1]
-            if mock_jules._send_message.call_args.args
-            else mock_jules._send_message.call_args.kwargs.get("message", "")
-        )
+        args, kwargs = mock_jules._send_message.call_args
+        sent_message = args[1] if len(args) > 1 else kwargs["message"]
         assert "Fix this" in sent_message
 
         mock_jules.run_session.assert_not_called()
@@ -1,30 +1,65 @@
 """Tests for StateManager (file-based state management)."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from ac_cdd_core.domain_models import CycleManifest, ProjectManifest
 from ac_cdd_core.session_manager import SessionValidationError
 from ac_cdd_core.state_manager import StateManager
 
+# Built and validated once; tests take deep copies with their own cycles
+_BASE_MANIFEST = ProjectManifest(
+    project_session_id="test", feature_branch="feat/test", integration_branch="dev/test"
+)
+
+
+def _test_manifest(*cycles: CycleManifest) -> ProjectManifest:
+    return _BASE_MANIFEST.model_copy(deep=True, update={"cycles": list(cycles)})
+
+
+# Serialized once for tests that only need existing state on disk to read from
+_SEEDED_MANIFEST_JSON = _test_manifest(
+    CycleManifest(id="01", status="planned"),
+    CycleManifest(id="02", status="in_progress"),
+).model_dump_json(indent=2)
+
+
+@pytest.fixture(scope="module")
+def state_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """State directory shared by the module; tests only ever touch the one file in it."""
+    return tmp_path_factory.mktemp(".ac_cdd")
+
+
+@pytest.fixture(scope="module")
+def shared_manager(state_dir: Path) -> StateManager:
+    """One StateManager for the module, pointed at the shared state file."""
+    mgr = StateManager()
+    mgr.STATE_FILE = state_dir / "project_state.json"
+    return mgr
+
 
 class TestStateManager:
     """Test suite for StateManager."""
 
     @pytest.fixture
-    def temp_state_file(self, tmp_path: Path) -> Path:
-        """Create a temporary state file path."""
-        state_dir = tmp_path / ".ac_cdd"
-        state_dir.mkdir(parents=True, exist_ok=True)
-        return state_dir / "project_state.json"
+    def temp_state_file(self, shared_manager: StateManager) -> Path:
+        """The shared state file, removed so each test starts without a manifest."""
+        shared_manager.STATE_FILE.unlink(missing_ok=True)
+        return shared_manager.STATE_FILE
 
     @pytest.fixture
-    def manager(self, temp_state_file: Path) -> StateManager:
-        """Create StateManager with temporary file."""
-        mgr = StateManager()
-        mgr.STATE_FILE = temp_state_file
-        return mgr
+    def seeded_state_file(self, temp_state_file: Path) -> Path:
+        """The state file holding a manifest with cycles 01 (planned) and 02 (in progress)."""
+        temp_state_file.write_text(_SEEDED_MANIFEST_JSON)
+        return temp_state_file
+
+    @pytest.fixture
+    def manager(self, shared_manager: StateManager, temp_state_file: Path) -> StateManager:
+        """The shared StateManager, after its state file has been reset."""
+        return shared_manager
 
     def test_load_manifest_not_found(self, manager: StateManager, temp_state_file: Path) -> None:
         """Test loading manifest when file doesn't exist."""
@@ -109,20 +144,8 @@ class TestStateManager:
         assert loaded is not None
         assert loaded.project_session_id == "new-session"
 
-    def test_get_cycle_found(self, manager: StateManager, temp_state_file: Path) -> None:
+    def test_get_cycle_found(self, manager: StateManager, seeded_state_file: Path) -> None:
         """Test getting an existing cycle."""
-        # Create manifest with cycles
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-            cycles=[
-                CycleManifest(id="01", status="planned"),
-                CycleManifest(id="02", status="in_progress"),
-            ],
-        )
-        manager.save_manifest(manifest)
-
         # Get cycle
         cycle = manager.get_cycle("02")
 
@@ -130,17 +153,8 @@ class TestStateManager:
         assert cycle.id == "02"
         assert cycle.status == "in_progress"
 
-    def test_get_cycle_not_found(self, manager: StateManager, temp_state_file: Path) -> None:
+    def test_get_cycle_not_found(self, manager: StateManager, seeded_state_file: Path) -> None:
         """Test getting a non-existent cycle."""
-        # Create manifest with cycles
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-            cycles=[CycleManifest(id="01", status="planned")],
-        )
-        manager.save_manifest(manifest)
-
         # Get non-existent cycle
         cycle = manager.get_cycle("99")
 
@@ -155,14 +169,9 @@ class TestStateManager:
     def test_update_cycle_state(self, manager: StateManager, temp_state_file: Path) -> None:
         """Test updating cycle state."""
         # Create manifest
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-            cycles=[
-                CycleManifest(id="01", status="planned"),
-                CycleManifest(id="02", status="planned"),
-            ],
+        manifest = _test_manifest(
+            CycleManifest(id="01", status="planned"),
+            CycleManifest(id="02", status="planned"),
         )
         manager.save_manifest(manifest)
 
@@ -172,12 +181,14 @@ class TestStateManager:
         # Verify update
         loaded = manager.load_manifest()
         assert loaded is not None
-        cycle = next(c for c in loaded.cycles if c.id == "01")
+        cycle = loaded.get_cycle("01")
+        assert cycle is not None
         assert cycle.status == "in_progress"
         assert cycle.jules_session_id == "session-123"
 
         # Verify other cycle unchanged
-        cycle2 = next(c for c in loaded.cycles if c.id == "02")
+        cycle2 = loaded.get_cycle("02")
+        assert cycle2 is not None
         assert cycle2.status == "planned"
 
     def test_update_cycle_state_no_manifest(
@@ -188,18 +199,9 @@ class TestStateManager:
             manager.update_cycle_state("01", status="in_progress")
 
     def test_update_cycle_state_cycle_not_found(
-        self, manager: StateManager, temp_state_file: Path
+        self, manager: StateManager, seeded_state_file: Path
     ) -> None:
         """Test updating non-existent cycle."""
-        # Create manifest
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-            cycles=[CycleManifest(id="01", status="planned")],
-        )
-        manager.save_manifest(manifest)
-
         # Try to update non-existent cycle
         with pytest.raises(SessionValidationError, match="Cycle 99 not found"):
             manager.update_cycle_state("99", status="in_progress")
@@ -209,11 +211,7 @@ class TestStateManager:
         from datetime import UTC, datetime
 
         # Create and save manifest
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-        )
+        manifest = _test_manifest()
 
         # Save
         manager.save_manifest(manifest)
@@ -230,11 +228,7 @@ class TestStateManager:
 
     def test_file_permissions(self, manager: StateManager, temp_state_file: Path) -> None:
         """Test that state file is created with correct permissions."""
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-        )
+        manifest = _test_manifest()
 
         manager.save_manifest(manifest)
 
@@ -243,21 +237,16 @@ class TestStateManager:
         assert temp_state_file.is_file()
 
         # Verify content is valid JSON
-        content = temp_state_file.read_text()
-        data = json.loads(content)
+        with temp_state_file.open("rb") as f:
+            data = json.load(f)
         assert data["project_session_id"] == "test"
 
     def test_concurrent_updates(self, manager: StateManager, temp_state_file: Path) -> None:
         """Test that updates don't corrupt the file."""
         # Create initial manifest
-        manifest = ProjectManifest(
-            project_session_id="test",
-            feature_branch="feat/test",
-            integration_branch="dev/test",
-            cycles=[
-                CycleManifest(id="01", status="planned"),
-                CycleManifest(id="02", status="planned"),
-            ],
+        manifest = _test_manifest(
+            CycleManifest(id="01", status="planned"),
+            CycleManifest(id="02", status="planned"),
         )
         manager.save_manifest(manifest)
 
@@ -269,7 +258,97 @@ class TestStateManager:
         # Verify final state
         loaded = manager.load_manifest()
         assert loaded is not None
-        cycle1 = next(c for c in loaded.cycles if c.id == "01")
-        cycle2 = next(c for c in loaded.cycles if c.id == "02")
+        cycle1 = loaded.get_cycle("01")
+        cycle2 = loaded.get_cycle("02")
+        assert cycle1 is not None
+        assert cycle2 is not None
         assert cycle1.status == "completed"
         assert cycle2.status == "in_progress"
+
+    def test_transaction_saves_once(self, manager: StateManager, seeded_state_file: Path) -> None:
+        """Test that updates inside a transaction are written in a single save."""
+        with (
+            patch.object(manager, "save_manifest", wraps=manager.save_manifest) as save,
+            manager.transaction(),
+        ):
+            manager.update_cycle_state("01", status="in_progress")
+            manager.update_cycle_state("02", status="completed")
+            manager.update_project_state(qa_session_id="qa-123")
+
+            # Nothing is written until the transaction ends
+            save.assert_not_called()
+
+        save.assert_called_once()
+        loaded = manager.load_manifest()
+        assert loaded is not None
+        assert loaded.qa_session_id == "qa-123"
+        cycle1 = loaded.get_cycle("01")
+        cycle2 = loaded.get_cycle("02")
+        assert cycle1 is not None
+        assert cycle2 is not None
+        assert cycle1.status == "in_progress"
+        assert cycle2.status == "completed"
+
+    def test_transaction_discards_on_error(
+        self, manager: StateManager, seeded_state_file: Path
+    ) -> None:
+        """Test that a failing transaction leaves the saved state untouched."""
+
+        def update_then_fail() -> None:
+            with manager.transaction():
+                manager.update_cycle_state("01", status="completed")
+                manager.update_cycle_state("99", status="completed")
+
+        with pytest.raises(SessionValidationError, match="Cycle 99 not found"):
+            update_then_fail()
+
+        cycle = manager.get_cycle("01")
+        assert cycle is not None
+        assert cycle.status == "planned"
+
+    def test_transaction_rejects_direct_save(
+        self, manager: StateManager, seeded_state_file: Path
+    ) -> None:
+        """Test that a direct save inside a transaction fails instead of being lost on exit."""
+        other = manager.load_manifest()
+        assert other is not None
+
+        def save_inside() -> None:
+            with manager.transaction():
+                manager.save_manifest(other)
+
+        with pytest.raises(RuntimeError, match="inside transaction"):
+            save_inside()
+
+    def test_load_manifest_sees_external_changes(
+        self, manager: StateManager, temp_state_file: Path
+    ) -> None:
+        """Test that an edit made outside the manager is seen by the next load."""
+        manager.create_manifest("before", "feat/test", "dev/test")
+
+        with temp_state_file.open("rb") as f:
+            data = json.load(f)
+        data["project_session_id"] = "edited-externally"
+        temp_state_file.write_text(json.dumps(data))
+
+        loaded = manager.load_manifest()
+
+        assert loaded is not None
+        assert loaded.project_session_id == "edited-externally"
+
+    def test_load_manifest_sees_same_size_external_changes(
+        self, manager: StateManager, temp_state_file: Path
+    ) -> None:
+        """Test that an outside edit keeping the file's size and mtime is still seen."""
+        manager.create_manifest("session-a", "feat/test", "dev/test")
+        before = temp_state_file.stat()
+
+        edited = temp_state_file.read_text().replace("session-a", "session-b")
+        temp_state_file.write_text(edited)
+        os.utime(temp_state_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert temp_state_file.stat().st_size == before.st_size
+
+        loaded = manager.load_manifest()
+
+        assert loaded is not None
+        assert loaded.project_session_id == "session-b"
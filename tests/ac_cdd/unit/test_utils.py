@@ -0,0 +1,26 @@
+from ac_cdd_core.utils import render_template_section
+
+TEMPLATE = (
+    "# PREVIOUS AUDIT FEEDBACK (MUST FIX)\n\nFix it\n\n"
+    "{{#pr_url}}\nPrevious PR: {{pr_url}}\n{{/pr_url}}"
+)
+
+
+def test_render_template_section_drops_section() -> None:
+    result = render_template_section(TEMPLATE, "pr_url", keep=False)
+
+    assert "pr_url" not in result
+    assert result.strip() == "# PREVIOUS AUDIT FEEDBACK (MUST FIX)\n\nFix it"
+
+
+def test_render_template_section_keeps_stripped_body() -> None:
+    result = render_template_section(TEMPLATE, "pr_url", keep=True)
+
+    assert result.endswith("Fix it\n\nPrevious PR: {{pr_url}}")
+
+
+def test_render_template_section_handles_repeated_and_unclosed_sections() -> None:
+    text = "a{{#x}}1{{/x}}b{{#x}}2{{/x}}c{{#x}}open"
+
+    assert render_template_section(text, "x", keep=False) == "abc{{#x}}open"
+    assert render_template_section(text, "x", keep=True) == "a1b2c{{#x}}open"
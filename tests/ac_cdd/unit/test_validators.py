@@ -5,7 +5,6 @@ from ac_cdd_core.domain_models import ProjectManifest
 from ac_cdd_core.validators import SessionValidator, ValidationError
 
 
-@pytest.mark.asyncio
 class TestSessionValidator:
     @patch("ac_cdd_core.validators.StateManager.load_manifest")
     async def test_session_validator_valid(self, mock_load: AsyncMock) -> None: